@@ -92,17 +92,12 @@ class BaseController:
     async def _send_command_and_wait(self, command_id: int, payload: bytes = b'') -> bytes:
         """Send command and wait for response"""
         try:
-            # Clear previous responses based on domain (polling pattern from existing code)
-            if self._char_name == 'config_commands':
-                # Config domain (Keys/Buttons) → _received_config_responses
-                if hasattr(self.connection, '_received_config_responses'):
-                    self.connection._received_config_responses = []
-                response_queue_attr = '_received_config_responses'
-            else:
-                # Device domain (LED/Buzzer/Settings/OTA) → _received_device_responses  
-                if hasattr(self.connection, '_received_device_responses'):
-                    self.connection._received_device_responses = []
-                response_queue_attr = '_received_device_responses'
+            # Response queue for this domain (config: Keys/Buttons, device: LED/Buzzer/Settings/OTA)
+            response_queue = self.connection.response_queue(self._char_name)
+            
+            # Drop stale responses left over from earlier commands
+            while not response_queue.empty():
+                response_queue.get_nowait()
             
             # Send command via connection (NOT recursive call)
             command_data = bytes([command_id]) + payload
@@ -110,17 +105,20 @@ class BaseController:
             if not success:
                 raise ConfigurationError(f"Failed to send command 0x{command_id:02X}")
             
-            # Wait for response using correct queue
-            start_time = asyncio.get_event_loop().time()
-            while (asyncio.get_event_loop().time() - start_time) < self._timeout:
-                if hasattr(self.connection, response_queue_attr):
-                    response_queue = getattr(self.connection, response_queue_attr)
-                    if response_queue:
-                        response = response_queue[-1]
-                        if len(response) >= 2 and response[1] == command_id:
-                            self._logger.debug(f"📥 Received response for 0x{command_id:02X}")
-                            return response
-                await asyncio.sleep(0.01)  # 10ms polling like existing code
+            # Wait for the matching response - woken per notification, no polling
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    response = await asyncio.wait_for(response_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if len(response) >= 2 and response[1] == command_id:
+                    self._logger.debug("📥 Received response for 0x%02X", command_id)
+                    return response
             
             raise TimeoutError(f"Command 0x{command_id:02X} timed out after {self._timeout}s")
             
@@ -7,6 +7,7 @@ with support for UTF-8 text, HID keys, consumer controls, and sequences.
 
 import asyncio
 import logging
+import struct
 from typing import List, Dict, Any, Optional, Union
 
 from .base import BaseController, Commands
@@ -405,9 +406,6 @@ class KeyConfigurationController(BaseController):
         Returns:
             Action dictionary
         """
-        import struct
-        from ..utils.constants import HardwareActions
-
         # Validate duration
         if not 1 <= duration_ms <= 5000:
             raise ValueError(f"Duration must be between 1-5000ms, got {duration_ms}")
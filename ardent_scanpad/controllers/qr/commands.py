@@ -10,8 +10,10 @@ Builds command payloads for different device domains:
 """
 
 import base64
+import functools
+import struct
 import zlib
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Union
 from pathlib import Path
 
 from ...utils.constants import (
@@ -19,6 +21,98 @@ from ...utils.constants import (
 )
 from ..base import Commands
 
+# ISA-L (pip install isal) compresses several times faster. Its output is a
+# standard zlib stream that any zlib inflates, but not byte-identical to
+# zlib's at the same level, so compare payloads by decompressing them
+try:
+    from isal import isal_zlib as _zlib_impl
+    _ISAL = True
+except ImportError:
+    _zlib_impl = zlib
+    _ISAL = False
+
+
+def _compress(data: bytes, level: int) -> bytes:
+    """zlib-compress data, mapping zlib levels 1-9 onto ISA-L's 0-3 when available."""
+    if _ISAL:
+        level = min(level - 1, 3)
+    return _zlib_impl.compress(data, level)
+
+
+# Fixed-size records of the $FULL: binary layout
+_KEY_HEADER = struct.Struct('<BB')        # [key_id][action_count]
+_TEXT_HEADER = struct.Struct('<BBB')      # [type][text_len][delay] + text bytes
+_ACTION_RECORD = struct.Struct('<BBBB')   # [type][value][mask][delay]
+_CONSUMER_RECORD = struct.Struct('<BHB')  # [type][code_lo][code_hi][delay]
+
+# Per-key (SET_KEY_CONFIG) action record
+_KEY_ACTION_RECORD = struct.Struct('<BBBBH')  # [index][type][value][mask][delay]
+
+# Lookup tables built once instead of per call
+_MELODY_MAP = {
+    name: value for name, value in vars(BuzzerMelodies).items()
+    if not name.startswith('_') and name != 'NAMES'
+}
+_ORIENTATION_NAMES = {0: "Normal", 1: "Right", 2: "Inverted", 3: "Left"}
+
+
+def _encode_utf8_action(key_id: int, action: 'Action') -> bytes:
+    """UTF-8 text action: [type=0][text_len][delay][text_data...]"""
+    text = action.text or ''
+    delay = action.delay
+    
+    text_bytes = text.encode('utf-8')
+    if len(text_bytes) > 8:
+        raise ValueError(f"Key {key_id} text too long (max 8 UTF-8 bytes): {text}")
+        
+    return _TEXT_HEADER.pack(0, len(text_bytes), delay & 0xFF) + text_bytes
+
+
+def _encode_hid_action(key_id: int, action: 'Action') -> bytes:
+    """HID action: [type=1][hid_code][modifiers][delay]"""
+    value = action.value
+    mask = action.mask
+    delay = action.delay
+
+    if not (0 <= value <= 255):
+        raise ValueError(f"Key {key_id} HID value must be 0-255: {value}")
+    if not (0 <= mask <= 255):
+        raise ValueError(f"Key {key_id} HID mask must be 0-255: {mask}")
+
+    return _ACTION_RECORD.pack(1, value, mask, delay & 0xFF)
+
+
+def _encode_consumer_action(key_id: int, action: 'Action') -> bytes:
+    """Consumer action: [type=2][code_low][code_high][delay]"""
+    value = action.value
+    delay = action.delay
+
+    if not (0 <= value <= 65535):
+        raise ValueError(f"Key {key_id} Consumer code must be 0-65535: {value}")
+
+    return _CONSUMER_RECORD.pack(2, value, delay & 0xFF)
+
+
+def _encode_modifier_toggle_action(key_id: int, action: 'Action') -> bytes:
+    """Modifier Toggle action (Mecalux sticky modifiers): [type=4][mask][reserved][delay]"""
+    mask = action.mask
+    delay = action.delay
+
+    if not (0 < mask <= 255):
+        raise ValueError(f"Key {key_id} Modifier mask must be 1-255: {mask}")
+
+    return _ACTION_RECORD.pack(4, mask, 0, delay & 0xFF)
+
+
+# $FULL: action encoders by action type
+_ACTION_ENCODERS = {
+    KeyTypes.UTF8: _encode_utf8_action,
+    KeyTypes.HID: _encode_hid_action,
+    KeyTypes.CONSUMER: _encode_consumer_action,
+    KeyTypes.MODIFIER_TOGGLE: _encode_modifier_toggle_action,
+}
+_ALLOWED_TYPES = frozenset(_ACTION_ENCODERS)
+
 
 class CommandData:
     """Container for command data"""
@@ -31,6 +125,60 @@ class CommandData:
         self.command_type = command_type
         self.description = description
         self.metadata = metadata or {}
+    
+    @functools.cached_property
+    def payload_hex(self) -> str:
+        """Upper-case hex of the payload, computed once (payload is immutable bytes)"""
+        return self.payload.hex().upper()
+
+
+class Action(NamedTuple):
+    """Immutable key action record used internally by the payload builders"""
+    type: int
+    value: int = 0
+    mask: int = 0
+    delay: int = 10
+    text: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Action':
+        """Build from an action dict, ignoring keys this record doesn't carry"""
+        return cls(**{key: data[key] for key in cls._fields if key in data})
+
+
+def _as_action(action: Union['Action', Dict[str, Any]]) -> Optional['Action']:
+    """Normalize an Action or action dict; None if it isn't a valid action"""
+    if isinstance(action, Action):
+        return action
+    if isinstance(action, dict) and 'type' in action:
+        return Action.from_dict(action)
+    return None
+
+
+# Prebuilt single-character text actions ('0'-'9', 'A'-'Z') for the standard
+# layouts - immutable, so configs can share them
+DIGIT_ACTIONS = tuple(
+    Action(KeyTypes.UTF8, text=char) for char in "0123456789"
+)
+LETTER_ACTIONS = tuple(
+    Action(KeyTypes.UTF8, text=chr(code)) for code in range(ord('A'), ord('Z') + 1)
+)
+
+
+def _validate_actions(actions: list, key_id: int) -> List[Action]:
+    """Validate one key's $FULL: action list, returning it as Action records"""
+    if not actions:
+        raise ValueError(f"Key {key_id} must have at least one action")
+    if len(actions) > 10:
+        raise ValueError(f"Key {key_id} has too many actions (max 10): {len(actions)}")
+    
+    normalized = [_as_action(action) for action in actions]
+    if not all(normalized):
+        raise ValueError(f"Key {key_id} action must be dict with 'type' key")
+    if not _ALLOWED_TYPES.issuperset(action.type for action in normalized):
+        action_type = next(a.type for a in normalized if a.type not in _ALLOWED_TYPES)
+        raise ValueError(f"Key {key_id} unsupported action type: {action_type}")
+    return normalized
 
 
 class LEDCommandBuilder:
@@ -74,15 +222,12 @@ class BuzzerCommandBuilder:
     """Buzzer command payload builder"""
     
     def create_buzzer_melody_command(self, melody_name: str) -> CommandData:
-        # Use BuzzerMelodies constants directly instead of mapping dict
-        melody_upper = melody_name.upper()
+        melody_id = _MELODY_MAP.get(melody_name.upper())
         
         # Validate melody name exists in BuzzerMelodies
-        if not hasattr(BuzzerMelodies, melody_upper):
-            available_melodies = [name for name in dir(BuzzerMelodies) if not name.startswith('_') and name != 'NAMES']
-            raise ValueError(f"Invalid melody '{melody_name}'. Must be one of: {available_melodies}")
+        if melody_id is None:
+            raise ValueError(f"Invalid melody '{melody_name}'. Must be one of: {list(_MELODY_MAP)}")
             
-        melody_id = getattr(BuzzerMelodies, melody_upper)
         payload = bytes([melody_id])
         
         return CommandData(
@@ -96,20 +241,16 @@ class DeviceCommandBuilder:
     """Device settings command payload builder"""
     
     def create_orientation_command(self, orientation: int) -> CommandData:
-        if orientation not in [0, 1, 2, 3]:
+        orientation_name = _ORIENTATION_NAMES.get(orientation)
+        if orientation_name is None:
             raise ValueError(f"Orientation must be 0-3, got {orientation}")
-            
-        orientation_names = {
-            0: "Normal", 1: "Right", 
-            2: "Inverted", 3: "Left"
-        }
         
         payload = bytes([orientation])
         
         return CommandData(
             Commands.DEVICE_SET_ORIENTATION, payload, 'device',
-            "Device Settings", f"Set orientation to {orientation_names[orientation]}",
-            {'orientation': orientation, 'orientation_name': orientation_names[orientation]}
+            "Device Settings", f"Set orientation to {orientation_name}",
+            {'orientation': orientation, 'orientation_name': orientation_name}
         )
     
     def create_lua_clear_command(self) -> CommandData:
@@ -134,11 +275,7 @@ class KeyConfigCommandBuilder:
         if len(text.encode('utf-8')) > 8:
             raise ValueError(f"Text too long (max 8 UTF-8 bytes): {text}")
             
-        return {
-            'type': KeyTypes.UTF8,
-            'text': text,
-            'delay': 10
-        }
+        return {'type': KeyTypes.UTF8, 'text': text, 'delay': 10}
     
     def create_hid_action(self, keycode: int, modifier: int = 0, delay: int = 10) -> Dict[str, Any]:
         if not (0 <= keycode <= 255):
@@ -146,22 +283,13 @@ class KeyConfigCommandBuilder:
         if not (0 <= modifier <= 255): 
             raise ValueError(f"HID modifier must be 0-255, got {modifier}")
             
-        return {
-            'type': KeyTypes.HID,
-            'value': keycode,
-            'mask': modifier,
-            'delay': delay
-        }
+        return {'type': KeyTypes.HID, 'value': keycode, 'mask': modifier, 'delay': delay}
     
     def create_consumer_action(self, control_code: int, delay: int = 10) -> Dict[str, Any]:
         if not (0 <= control_code <= 65535):
             raise ValueError(f"Consumer control code must be 0-65535, got {control_code}")
 
-        return {
-            'type': KeyTypes.CONSUMER,
-            'value': control_code,
-            'delay': delay
-        }
+        return {'type': KeyTypes.CONSUMER, 'value': control_code, 'delay': delay}
 
     def create_modifier_toggle_action(self, modifier_mask: int, delay: int = 10) -> Dict[str, Any]:
         """
@@ -200,44 +328,51 @@ class KeyConfigCommandBuilder:
         if not actions:
             raise ValueError("At least one action required")
             
-        # Build payload matching keys controller format: [key_id][action_count][actions...]
-        payload = bytearray([key_id, len(actions)])
-        
+        # Validate and size every action first so the payload is allocated once
+        records = []
+        payload_size = _KEY_HEADER.size
         for i, action in enumerate(actions):
-            if not isinstance(action, dict) or 'type' not in action:
+            action = _as_action(action)
+            if action is None:
                 raise ValueError(f"Action {i} must be dict with 'type' key")
                 
-            action_type = action['type']
-            value = action.get('value', 0)
-            mask = action.get('mask', 0) 
-            delay = action.get('delay', 10)
-            
-            # Add action following keys controller format:
-            # [action_index][action_type][value][mask][delay_low][delay_high]
-            payload.extend([
-                i,  # action index
-                action_type,
-                value & 0xFF,
-                mask,
-                delay & 0xFF,        # delay low byte
-                (delay >> 8) & 0xFF  # delay high byte
-            ])
+            action_type = action.type
+            text_bytes = None
             
-            # Add UTF-8 text data for text actions (matching keys controller)
-            if action_type == KeyTypes.UTF8 and 'text' in action:
-                text = action['text']
+            # UTF-8 text data for text actions (matching keys controller)
+            if action_type == KeyTypes.UTF8 and action.text is not None:
+                text = action.text
                 if text:
                     text_bytes = text.encode('utf-8')
-                    if len(text_bytes) <= 8:
-                        # UTF-8 fits within 8-byte limit
-                        payload.extend([len(text_bytes)] + list(text_bytes))
-                    else:
-                        # UTF-8 exceeds 8-byte limit - truncate
-                        truncated_bytes = text_bytes[:8]
-                        payload.extend([len(truncated_bytes)] + list(truncated_bytes))
+                    # UTF-8 beyond the 8-byte limit is truncated
+                    text_bytes = text_bytes[:8]
                 else:
-                    # Empty text
-                    payload.extend([0])  # No UTF-8 data
+                    text_bytes = b''  # No UTF-8 data
+                payload_size += 1 + len(text_bytes)
+                
+            records.append((action_type, action.value, action.mask, action.delay, text_bytes))
+            payload_size += _KEY_ACTION_RECORD.size
+        
+        # Build payload matching keys controller format: [key_id][action_count][actions...]
+        payload = bytearray(payload_size)
+        _KEY_HEADER.pack_into(payload, 0, key_id, len(actions))
+        offset = _KEY_HEADER.size
+        
+        for i, (action_type, value, mask, delay, text_bytes) in enumerate(records):
+            # [action_index][action_type][value][mask][delay_low][delay_high]
+            try:
+                _KEY_ACTION_RECORD.pack_into(
+                    payload, offset, i, action_type, value & 0xFF, mask, delay & 0xFFFF
+                )
+            except struct.error as e:
+                raise ValueError(f"Action {i} field out of range: {e}")
+            offset += _KEY_ACTION_RECORD.size
+            
+            if text_bytes is not None:
+                # [text_len][text_data...]
+                payload[offset] = len(text_bytes)
+                payload[offset + 1:offset + 1 + len(text_bytes)] = text_bytes
+                offset += 1 + len(text_bytes)
         
         # Get key name
         key_name = KeyIDs.NAMES.get(key_id, f"Key {key_id}")
@@ -265,107 +400,75 @@ class FullConfigCommandBuilder:
             raise ValueError("Compression level must be 1-9")
             
         # Validate key IDs and actions
+        validated = {}
         for key_id, actions in keyboard_config.items():
             if not (0 <= key_id <= 19):
                 raise ValueError(f"Key ID must be 0-19, got {key_id}")
-            if not actions:
-                raise ValueError(f"Key {key_id} must have at least one action")
-            if len(actions) > 10:
-                raise ValueError(f"Key {key_id} has too many actions (max 10): {len(actions)}")
+            validated[key_id] = _validate_actions(actions, key_id)
                 
-        # Build binary configuration
-        binary_config = bytearray()
-        
+        # Build binary configuration as a list of packed records joined once
         # Header: Magic + Version + Key Count
-        binary_config.extend(b"GYW")  # Magic header
-        binary_config.append(0x01)   # Version
-        binary_config.append(len(keyboard_config))  # Key count
+        parts = [b"GYW\x01", bytes([len(keyboard_config)])]
         
         # Process each key
         total_actions = 0
-        for key_id in sorted(keyboard_config.keys()):
-            actions = keyboard_config[key_id]
+        for key_id in sorted(validated):
+            actions = validated[key_id]
             
             # Key header: [key_id][action_count]
-            binary_config.append(key_id)
-            binary_config.append(len(actions))
+            parts.append(_KEY_HEADER.pack(key_id, len(actions)))
             
             # Process each action
             for action in actions:
-                if not isinstance(action, dict) or 'type' not in action:
-                    raise ValueError(f"Key {key_id} action must be dict with 'type' key")
-                    
-                action_type = action['type']
-                
-                if action_type == KeyTypes.UTF8:
-                    # UTF-8 text action: [type=0][text_len][delay][text_data...]
-                    text = action.get('text', '')
-                    delay = action.get('delay', 10)
-                    
-                    text_bytes = text.encode('utf-8')
-                    if len(text_bytes) > 8:
-                        raise ValueError(f"Key {key_id} text too long (max 8 UTF-8 bytes): {text}")
-                        
-                    binary_config.append(0)  # UTF-8 type
-                    binary_config.append(len(text_bytes))  # text length
-                    binary_config.append(delay & 0xFF)     # delay
-                    binary_config.extend(text_bytes)       # text data
-                    
-                elif action_type == KeyTypes.HID:
-                    # HID action: [type=1][hid_code][modifiers][delay]
-                    value = action.get('value', 0)
-                    mask = action.get('mask', 0)
-                    delay = action.get('delay', 10)
-
-                    if not (0 <= value <= 255):
-                        raise ValueError(f"Key {key_id} HID value must be 0-255: {value}")
-                    if not (0 <= mask <= 255):
-                        raise ValueError(f"Key {key_id} HID mask must be 0-255: {mask}")
-
-                    binary_config.append(1)        # HID type
-                    binary_config.append(value)    # HID keycode
-                    binary_config.append(mask)     # HID modifiers
-                    binary_config.append(delay & 0xFF)  # delay
-
-                elif action_type == KeyTypes.CONSUMER:
-                    # Consumer action: [type=2][code_low][code_high][delay]
-                    value = action.get('value', 0)
-                    delay = action.get('delay', 10)
-
-                    if not (0 <= value <= 65535):
-                        raise ValueError(f"Key {key_id} Consumer code must be 0-65535: {value}")
-
-                    binary_config.append(2)               # Consumer type
-                    binary_config.append(value & 0xFF)    # Consumer code low byte
-                    binary_config.append((value >> 8) & 0xFF)  # Consumer code high byte
-                    binary_config.append(delay & 0xFF)    # delay
-
-                elif action_type == KeyTypes.MODIFIER_TOGGLE:
-                    # Modifier Toggle action: [type=4][mask][reserved][delay]
-                    # Mecalux feature - sticky modifiers
-                    mask = action.get('mask', 0)
-                    delay = action.get('delay', 10)
-
-                    if not (0 < mask <= 255):
-                        raise ValueError(f"Key {key_id} Modifier mask must be 1-255: {mask}")
-
-                    binary_config.append(4)        # MODIFIER_TOGGLE type
-                    binary_config.append(mask)     # Modifier bitmask to toggle
-                    binary_config.append(0)        # Reserved (value field, unused)
-                    binary_config.append(delay & 0xFF)  # delay
-
-                else:
-                    raise ValueError(f"Key {key_id} unsupported action type: {action_type}")
-                    
+                parts.append(_ACTION_ENCODERS[action.type](key_id, action))
                 total_actions += 1
         
+        return self._finish_config(
+            b"".join(parts), len(keyboard_config), total_actions, compression_level
+        )
+    
+    def create_text_layout_config(self,
+                                  key_texts: Dict[int, str],
+                                  compression_level: int = 6) -> CommandData:
+        """$FULL: config with a single text action per key, packed directly from the strings"""
+        if not key_texts:
+            raise ValueError("Keyboard configuration cannot be empty")
+            
+        if not (1 <= compression_level <= 9):
+            raise ValueError("Compression level must be 1-9")
+        
+        # Header: Magic + Version + Key Count
+        parts = [b"GYW\x01", bytes([len(key_texts)])]
+        
+        for key_id in sorted(key_texts):
+            if not (0 <= key_id <= 19):
+                raise ValueError(f"Key ID must be 0-19, got {key_id}")
+            
+            text = key_texts[key_id]
+            text_bytes = text.encode('utf-8')
+            if len(text_bytes) > 8:
+                raise ValueError(f"Key {key_id} text too long (max 8 UTF-8 bytes): {text}")
+            
+            # [key_id][action_count=1] + [type=0][text_len][delay=10][text_data...]
+            parts.append(_KEY_HEADER.pack(key_id, 1))
+            parts.append(_TEXT_HEADER.pack(0, len(text_bytes), 10) + text_bytes)
+        
+        return self._finish_config(
+            b"".join(parts), len(key_texts), len(key_texts), compression_level
+        )
+    
+    def _finish_config(self, binary_config: bytes, keys_configured: int,
+                       total_actions: int, compression_level: int) -> CommandData:
+        """Compress and encode a packed $FULL: binary into its CommandData"""
         # Compress binary configuration
         try:
-            compressed_data = zlib.compress(bytes(binary_config), level=compression_level)
+            compressed_data = _compress(binary_config, compression_level)
         except Exception as e:
             raise ValueError(f"Compression failed: {e}")
             
-        # Encode to Base64
+        # Encode to Base64. The firmware's $FULL: parser only accepts base64;
+        # a denser alphanumeric encoding (base45) would need a new prefix on
+        # the device side first.
         try:
             b64_data = base64.b64encode(compressed_data).decode('ascii')
         except Exception as e:
@@ -377,10 +480,10 @@ class FullConfigCommandBuilder:
         b64_size = len(b64_data)
         compression_ratio = (compressed_size / original_size) * 100 if original_size > 0 else 0
         
-        description = f"Full keyboard: {len(keyboard_config)} keys, {total_actions} actions"
+        description = f"Full keyboard: {keys_configured} keys, {total_actions} actions"
         
         metadata = {
-            'keys_configured': len(keyboard_config),
+            'keys_configured': keys_configured,
             'total_actions': total_actions,
             'original_size_bytes': original_size,
             'compressed_size_bytes': compressed_size,
@@ -397,15 +500,27 @@ class FullConfigCommandBuilder:
         )
 
 
+def _lua_compression_level(script_size: int, max_qr_size: int) -> int:
+    """Default zlib level for a script: fast when it fits a frame or two, max when it spans many"""
+    if script_size < 2 * max_qr_size:
+        return 1
+    if script_size > 10 * max_qr_size:
+        return 9  # every frame saved is a QR code less to render and scan
+    return 6
+
+
 class LuaCommandBuilder:
     """Lua script command builder"""
     
     def create_lua_script_commands(self, 
                                   script_content: str,
                                   max_qr_size: int = 1000,
-                                  compression_level: int = 6) -> List[CommandData]:
+                                  compression_level: Optional[int] = None) -> List[CommandData]:
         if not script_content.strip():
             raise ValueError("Script content cannot be empty")
+        
+        if compression_level is None:
+            compression_level = _lua_compression_level(len(script_content), max_qr_size)
             
         if not (1 <= compression_level <= 9):
             raise ValueError("Compression level must be 1-9")
@@ -416,7 +531,7 @@ class LuaCommandBuilder:
         try:
             # Compress the script
             script_bytes = script_content.encode('utf-8')
-            compressed_data = zlib.compress(script_bytes, level=compression_level)
+            compressed_data = _compress(script_bytes, compression_level)
             
             # Encode to base64
             b64_data = base64.b64encode(compressed_data).decode('ascii')
@@ -15,30 +15,31 @@ from .commands import CommandData
 class QRFormatter:
     """Base QR formatter"""
     
+    # Domain -> formatter method name
+    _DOMAIN_FORMATTERS = {
+        'device': '_format_device_command',
+        'config': '_format_config_command',
+        'full': '_format_full_command',
+        'lua': '_format_lua_command',
+    }
+    
     def format_command(self, command_data: CommandData) -> str:
         """Format CommandData into QR scannable string"""
-        domain = command_data.domain
-        
-        if domain == 'device':
-            return self._format_device_command(command_data)
-        elif domain == 'config':
-            return self._format_config_command(command_data)
-        elif domain == 'full':
-            return self._format_full_command(command_data)
-        elif domain == 'lua':
-            return self._format_lua_command(command_data)
-        else:
-            raise ValueError(f"Unknown command domain: {domain}")
+        method_name = self._DOMAIN_FORMATTERS.get(command_data.domain)
+        if method_name is None:
+            raise ValueError(f"Unknown command domain: {command_data.domain}")
+        return getattr(self, method_name)(command_data)
+    
+    # $CMD: strings are built in one f-string; the payload hex is computed
+    # once on CommandData and shared with the command metadata
     
     def _format_device_command(self, cmd: CommandData) -> str:
         """Format device domain command: $CMD:DEV:xxxx$"""
-        hex_data = cmd.payload.hex().upper()
-        return f"$CMD:DEV:{cmd.command_id:02X}{hex_data}CMD$"
+        return f"$CMD:DEV:{cmd.command_id:02X}{cmd.payload_hex}CMD$"
     
     def _format_config_command(self, cmd: CommandData) -> str:
         """Format config domain command: $CMD:KEY:xxxx$"""
-        hex_data = cmd.payload.hex().upper()
-        return f"$CMD:KEY:{cmd.command_id:02X}{hex_data}CMD$"
+        return f"$CMD:KEY:{cmd.command_id:02X}{cmd.payload_hex}CMD$"
     
     def _format_full_command(self, cmd: CommandData) -> str:
         """Format full keyboard config: $FULL:xxxx$"""
@@ -7,33 +7,148 @@ Handles QR code image generation with PIL:
 - Batch saving functionality
 """
 
+import functools
+import importlib.util
+import io
 import logging
-from typing import Optional, Dict, Any, Union, List
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, Union, List
 from pathlib import Path
 
-try:
-    import qrcode
-    from PIL import Image, ImageDraw, ImageFont
-    QR_AVAILABLE = True
-except ImportError:
-    QR_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
+# qrcode/PIL (and the optional faster segno encoder) are imported on first
+# render by _qr_available(), so building command strings never pays for them
+qrcode = PIL = Image = ImageDraw = ImageFont = ImageOps = segno = None
+
+# Optional speed-ups, filled in by _qr_available() on first render
+PILLOW_SIMD = False
+SEGNO_AVAILABLE = False
+_SEGNO_ERROR: Dict[int, str] = {}
+
+# Title fonts, tried in order (macOS, Windows, Linux)
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "DejaVuSans.ttf",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def qr_dependencies_installed() -> bool:
+    """Whether qrcode and PIL are installed, checked without importing them"""
+    return all(importlib.util.find_spec(name) is not None for name in ('qrcode', 'PIL'))
+
+
+@functools.lru_cache(maxsize=None)
+def _qr_available() -> bool:
+    """Import the rendering libraries once; False when qrcode/PIL are missing"""
+    global qrcode, PIL, Image, ImageDraw, ImageFont, ImageOps, segno
+    global PILLOW_SIMD, SEGNO_AVAILABLE, _SEGNO_ERROR
+    
+    try:
+        import qrcode
+        import PIL
+        from PIL import Image, ImageDraw, ImageFont, ImageOps
+    except ImportError:
+        return False
+    
+    # Pillow-SIMD (pip install pillow-simd) is a drop-in Pillow build with
+    # SIMD resize/paste/convert kernels; its versions carry a ".postN" suffix
+    PILLOW_SIMD = '.post' in PIL.__version__
+    
+    # Optional faster encoder (pip install segno); qrcode is the fallback
+    try:
+        import segno
+        SEGNO_AVAILABLE = True
+    except ImportError:
+        pass
+    
+    # qrcode error-correction constants -> segno error levels
+    _SEGNO_ERROR = {
+        qrcode.constants.ERROR_CORRECT_L: 'l',
+        qrcode.constants.ERROR_CORRECT_M: 'm',
+        qrcode.constants.ERROR_CORRECT_Q: 'q',
+        qrcode.constants.ERROR_CORRECT_H: 'h',
+    }
+    
+    return True
+
+
+def __getattr__(name: str):
+    """QR_AVAILABLE is answered without importing qrcode/PIL"""
+    if name == 'QR_AVAILABLE':
+        return qr_dependencies_installed()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_font(size: int) -> 'ImageFont.ImageFont':
+    """Load the first available TrueType font, else PIL's default font"""
+    for path in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def _title_fonts() -> tuple:
+    """(title, description) fonts, parsed once on the first titled image"""
+    return _load_font(14), _load_font(10)
+
+
+# Reusable QRCode objects, one set per thread (QRCode holds mutable state)
+_qr_templates = threading.local()
+
+
+def _get_qr(border: int, error_correction: int, mask_pattern: Optional[int]) -> 'qrcode.QRCode':
+    """Return a cleared QRCode for these settings, reusing a cached instance"""
+    cache = getattr(_qr_templates, 'cache', None)
+    if cache is None:
+        cache = _qr_templates.cache = {}
+    
+    key = (border, error_correction, mask_pattern)
+    qr = cache.get(key)
+    if qr is None:
+        qr = cache[key] = qrcode.QRCode(
+            version=1,
+            error_correction=error_correction,
+            box_size=10,
+            border=border,
+            mask_pattern=mask_pattern,
+        )
+    else:
+        qr.clear()
+        qr.version = 1  # fit=True grows from here, don't keep the last size
+    return qr
+
 
 class QRImageGenerator:
     """Generates QR code images with customization"""
     
     def __init__(self):
-        self._validate_dependencies()
+        # Checked on the first render, which is what imports qrcode/PIL
+        self._dependencies_ok: Optional[bool] = None
     
-    def _validate_dependencies(self):
+    def _validate_dependencies(self) -> bool:
         """Check if required libraries are available"""
-        if not QR_AVAILABLE:
-            logger.warning(
-                "QR code generation requires additional dependencies. "
-                "Install with: pip install qrcode[pil]"
-            )
+        if self._dependencies_ok is None:
+            self._dependencies_ok = _qr_available()
+            if not self._dependencies_ok:
+                logger.warning(
+                    "QR code generation requires additional dependencies. "
+                    "Install with: pip install qrcode[pil]"
+                )
+            elif not PILLOW_SIMD:
+                logger.debug("Using stock Pillow; pillow-simd is a faster drop-in replacement")
+        return self._dependencies_ok
     
     def generate_qr_image(self, 
                          qr_data: str,
@@ -42,7 +157,8 @@ class QRImageGenerator:
                          size: int = 300,
                          border: int = 4,
                          error_correction=None,
-                         add_title: bool = True) -> Optional[Image.Image]:
+                         add_title: bool = True,
+                         mask_pattern: Optional[int] = 0) -> 'Image.Image':
         """
         Generate QR code image
         
@@ -54,72 +170,49 @@ class QRImageGenerator:
             border: QR code border thickness
             error_correction: QR error correction level
             add_title: Whether to add title area
+            mask_pattern: Fixed QR mask (0-7); None scores all 8 masks (slower,
+                marginally more even module spread)
             
         Returns:
-            PIL Image object or None if qrcode not available
-        """
-        if not QR_AVAILABLE:
-            logger.warning("qrcode library not available. Install with: pip install qrcode[pil]")
-            return None
+            PIL Image object
             
+        Raises:
+            RuntimeError: If qrcode/PIL are not installed
+        """
+        if not self._validate_dependencies():
+            raise RuntimeError("qrcode/PIL not installed; pip install qrcode[pil]")
         if error_correction is None:
             error_correction = qrcode.constants.ERROR_CORRECT_M
-            
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=error_correction,
-            box_size=10,
-            border=border,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
+        if not add_title:
+            title = description = ""
         
-        # Generate image
-        qr_img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Resize to requested size
-        qr_img = qr_img.resize((size, size), Image.Resampling.LANCZOS)
-        
-        # Add title if requested
-        if add_title and (title or description):
-            qr_img = self._add_title_to_image(qr_img, title, description, size)
-            
-        return qr_img
+        # Rendered images are memoized and shared - hand out a private copy
+        return _render_qr(
+            qr_data, title, description, size, border, error_correction, mask_pattern
+        ).copy()
     
-    def _add_title_to_image(self, qr_img: Image.Image, title: str, description: str, qr_size: int) -> Image.Image:
+    @staticmethod
+    def _add_title_to_image(qr_img: 'Image.Image', title: str, description: str, qr_size: int) -> 'Image.Image':
         """Add title and description to QR image"""
-        if not QR_AVAILABLE:
+        if not title and not description:
             return qr_img
-            
-        # Calculate title area height
-        title_height = 60
-        total_height = qr_size + title_height
         
-        # Create new image with title area
-        final_img = Image.new('RGB', (qr_size, total_height), 'white')
+        # Title area height
+        title_height = 60
         
-        # Paste QR code
-        final_img.paste(qr_img, (0, title_height))
+        # Grow the (grayscale - content is monochrome) QR upwards by the title area
+        final_img = ImageOps.expand(qr_img.convert('L'), border=(0, title_height, 0, 0), fill=255)
         
         # Add text
         draw = ImageDraw.Draw(final_img)
-        
-        try:
-            # Try to use a better font
-            font_title = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 14)
-            font_desc = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 10)
-        except:
-            # Fallback to default font
-            font_title = ImageFont.load_default()
-            font_desc = ImageFont.load_default()
+        font_title, font_desc = _title_fonts()
         
         # Draw title
         if title:
             title_bbox = draw.textbbox((0, 0), title, font=font_title)
             title_width = title_bbox[2] - title_bbox[0]
             title_x = (qr_size - title_width) // 2
-            draw.text((title_x, 5), title, fill='black', font=font_title)
+            draw.text((title_x, 5), title, fill=0, font=font_title)
         
         # Draw description  
         if description:
@@ -127,11 +220,121 @@ class QRImageGenerator:
             desc_bbox = draw.textbbox((0, 0), desc_text, font=font_desc)
             desc_width = desc_bbox[2] - desc_bbox[0]
             desc_x = (qr_size - desc_width) // 2
-            draw.text((desc_x, 25), desc_text, fill='gray', font=font_desc)
+            draw.text((desc_x, 25), desc_text, fill=128, font=font_desc)
         
         return final_img
 
 
+# Module matrix byte (1 = dark module) -> '1;8' raw pixel byte (0 = black)
+_DARK_TO_BLACK = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+
+def _matrix_to_image(rows, border: int, scale: int) -> 'Image.Image':
+    """Bilevel image built straight from the module matrix, without per-module drawing"""
+    width = len(rows) + 2 * border
+    quiet_rows = b'\x01' * (width * border)
+    quiet_side = b'\x01' * border
+    
+    # One byte per module, whole matrix handed to PIL in a single buffer
+    pixels = b''.join([
+        quiet_rows,
+        *(quiet_side + bytes(row).translate(_DARK_TO_BLACK) + quiet_side for row in rows),
+        quiet_rows,
+    ])
+    qr_img = Image.frombytes('1', (width, width), pixels, 'raw', '1;8')
+    
+    if scale > 1:
+        qr_img = qr_img.resize((width * scale, width * scale), Image.Resampling.NEAREST)
+    return qr_img
+
+
+def _make_qr_bitmap_qrcode(qr_data: str, size: int, border: int,
+                           error_correction: int, mask_pattern: Optional[int]) -> 'Image.Image':
+    """Encode and draw the bare QR symbol with the pure-Python qrcode package"""
+    qr = _get_qr(border, error_correction, mask_pattern)
+    qr.add_data(qr_data)
+    qr.make(fit=True)
+    
+    # Render at the largest whole-pixel module size that fits, so no
+    # resampling filter is needed to reach the requested size
+    modules_per_side = qr.modules_count + 2 * border
+    return _matrix_to_image(qr.modules, border, max(1, size // modules_per_side))
+
+
+def _make_qr_bitmap_segno(qr_data: str, size: int, border: int,
+                          error_correction: int, mask_pattern: Optional[int]) -> 'Image.Image':
+    """Encode and draw the bare QR symbol with segno (much faster on large versions)"""
+    qr = segno.make(
+        qr_data,
+        error=_SEGNO_ERROR[error_correction],
+        mask=mask_pattern,
+        micro=False,
+        boost_error=False,
+    )
+    
+    # Same whole-pixel module sizing and matrix blit as the qrcode path;
+    # segno rows are bytearrays of 0/1 modules, no PNG round-trip needed
+    modules_per_side = qr.symbol_size(border=border)[0]
+    return _matrix_to_image(qr.matrix, border, max(1, size // modules_per_side))
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_IHDR = struct.Struct('>IIBBBBB')  # width, height, depth, color type, compression, filter, interlace
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Length-prefixed, CRC-suffixed PNG chunk"""
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+
+def _encode_png_1bit(qr_img: 'Image.Image', compress_level: int) -> bytes:
+    """Encode a mode '1' image as 1-bit greyscale PNG, without filter selection"""
+    width, height = qr_img.size
+    stride = (width + 7) // 8
+    
+    # PIL packs mode '1' rows MSB-first with 1 = white, exactly PNG's layout;
+    # each scanline only needs its filter-type byte (0 = None) prepended
+    packed = qr_img.tobytes()
+    scanlines = b''.join(
+        b'\x00' + packed[row:row + stride] for row in range(0, len(packed), stride)
+    )
+    
+    return b''.join((
+        _PNG_SIGNATURE,
+        _png_chunk(b'IHDR', _PNG_IHDR.pack(width, height, 1, 0, 0, 0, 0)),
+        _png_chunk(b'IDAT', zlib.compress(scanlines, compress_level)),
+        _png_chunk(b'IEND', b''),
+    ))
+
+
+@functools.lru_cache(maxsize=256)
+def _render_qr(qr_data: str, title: str, description: str, size: int, border: int,
+               error_correction: int, mask_pattern: Optional[int]) -> 'Image.Image':
+    """Render a QR image; memoized so repeated codes in a batch are drawn once"""
+    if not _qr_available():
+        raise RuntimeError("qrcode/PIL not installed; pip install qrcode[pil]")
+    
+    if SEGNO_AVAILABLE:
+        qr_img = _make_qr_bitmap_segno(qr_data, size, border, error_correction, mask_pattern)
+    else:
+        qr_img = _make_qr_bitmap_qrcode(qr_data, size, border, error_correction, mask_pattern)
+    
+    # Pad (or, for very dense codes, shrink) to the exact requested size
+    if qr_img.size[0] < size:
+        offset = (size - qr_img.size[0]) // 2
+        padded = Image.new(qr_img.mode, (size, size), 1)
+        padded.paste(qr_img, (offset, offset))
+        qr_img = padded
+    elif qr_img.size[0] > size:
+        qr_img = qr_img.resize((size, size), Image.Resampling.NEAREST)
+    
+    # Add title if requested
+    if title or description:
+        qr_img = QRImageGenerator._add_title_to_image(qr_img, title, description, size)
+        
+    return qr_img
+
+
 class QRImageSaver:
     """Handles QR image saving operations"""
     
@@ -139,11 +342,35 @@ class QRImageSaver:
         self._generator = QRImageGenerator()
         self._logger = logging.getLogger(self.__class__.__name__)
     
+    def qr_png_bytes(self,
+                     qr_data: str,
+                     title: str = "",
+                     description: str = "",
+                     compress_level: int = 1,
+                     **image_options) -> bytes:
+        """Render a QR code and return it PNG-encoded, without touching disk"""
+        qr_image = self._generator.generate_qr_image(
+            qr_data, title, description, **image_options
+        )
+        return self.image_png_bytes(qr_image, compress_level)
+    
+    @staticmethod
+    def image_png_bytes(qr_image: 'Image.Image', compress_level: int = 1) -> bytes:
+        """PNG-encode an already rendered QR image"""
+        if qr_image.mode == '1':
+            # Untitled codes are bilevel: use the direct encoder
+            return _encode_png_1bit(qr_image, compress_level)
+        
+        buffer = io.BytesIO()
+        qr_image.save(buffer, 'PNG', compress_level=compress_level, optimize=False)
+        return buffer.getvalue()
+    
     def save_qr_image(self, 
                      qr_data: str,
                      filename: Union[str, Path],
                      title: str = "",
                      description: str = "",
+                     compress_level: int = 1,
                      **image_options) -> bool:
         """
         Save QR code as PNG image
@@ -153,21 +380,30 @@ class QRImageSaver:
             filename: Output filename
             title: Title text
             description: Description text
+            compress_level: PNG zlib level (0-9); 1 is nearly as small as
+                the default 6 for black/white QR images and much faster
             **image_options: Additional arguments for generate_qr_image()
             
         Returns:
             True if saved successfully
         """
         try:
-            qr_image = self._generator.generate_qr_image(
-                qr_data, title, description, **image_options
+            png_data = self.qr_png_bytes(
+                qr_data, title, description, compress_level, **image_options
             )
-                
-            if qr_image is None:
-                self._logger.error("Cannot generate QR image - qrcode library not available")
-                return False
-                
-            qr_image.save(filename, 'PNG')
+            Path(filename).write_bytes(png_data)
+            self._logger.info(f"QR code saved to {filename}")
+            return True
+            
+        except Exception as e:
+            self._logger.error(f"Failed to save QR code: {e}")
+            return False
+    
+    def save_image(self, qr_image: 'Image.Image', filename: Union[str, Path],
+                   compress_level: int = 1) -> bool:
+        """Save an already rendered QR image as PNG, returning True on success"""
+        try:
+            Path(filename).write_bytes(self.image_png_bytes(qr_image, compress_level))
             self._logger.info(f"QR code saved to {filename}")
             return True
             
@@ -179,6 +415,8 @@ class QRImageSaver:
                                qr_data_list: List[Dict[str, Any]],
                                output_dir: Union[str, Path],
                                filename_prefix: str = "qr_",
+                               max_workers: Optional[int] = None,
+                               use_processes: bool = False,
                                **image_options) -> List[str]:
         """
         Save multiple QR codes to files
@@ -187,6 +425,9 @@ class QRImageSaver:
             qr_data_list: List of dicts with 'qr_data', 'title', 'description' keys
             output_dir: Output directory path
             filename_prefix: Prefix for generated filenames
+            max_workers: Parallel workers (default: CPU count)
+            use_processes: Use a process pool - faster for large batches of
+                dense codes, whose pure-Python encoding holds the GIL
             **image_options: Additional arguments for QR generation
             
         Returns:
@@ -196,41 +437,61 @@ class QRImageSaver:
         output_path.mkdir(parents=True, exist_ok=True)
         
         saved_files = []
+        jobs = []
+        # Identical payloads (same data, title and description) render to
+        # identical PNGs: encode each once and write it to every target path
+        renders = {}
+        compress_level = image_options.pop('compress_level', 1)
         
-        for i, qr_item in enumerate(qr_data_list):
-            qr_data = qr_item.get('qr_data', '')
-            title = qr_item.get('title', '')
-            description = qr_item.get('description', '')
-            
-            # Generate safe filename from description
-            safe_desc = "".join(c for c in description if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_desc = safe_desc.replace(' ', '_')[:50]  # Limit length
-            
-            filename = f"{filename_prefix}{i:03d}_{safe_desc}.png"
-            filepath = output_path / filename
+        # Each image renders and encodes independently - PNG encoding in
+        # Pillow releases the GIL, so a thread pool overlaps the work
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers or os.cpu_count()) as executor:
+            for i, qr_item in enumerate(qr_data_list):
+                qr_data = qr_item.get('qr_data', '')
+                title = qr_item.get('title', '')
+                description = qr_item.get('description', '')
+                
+                # Generate safe filename from description
+                safe_desc = "".join(c for c in description if c.isalnum() or c in (' ', '-', '_')).strip()
+                safe_desc = safe_desc.replace(' ', '_')[:50]  # Limit length
+                
+                filename = f"{filename_prefix}{i:03d}_{safe_desc}.png"
+                filepath = output_path / filename
+                
+                key = (qr_data, title, description)
+                future = renders.get(key)
+                if future is None:
+                    future = renders[key] = executor.submit(
+                        _qr_png_job, qr_data, title, description, compress_level, image_options
+                    )
+                jobs.append((filepath, future))
             
-            try:
-                if self.save_qr_image(qr_data, filepath, title, description, **image_options):
+            # Collect in submission order so the result list matches the input
+            for filepath, future in jobs:
+                try:
+                    filepath.write_bytes(future.result())
                     saved_files.append(str(filepath))
                     self._logger.info(f"Saved QR code: {filepath}")
-                else:
-                    self._logger.error(f"Failed to save QR code: {filepath}")
-            except Exception as e:
-                self._logger.error(f"Error saving {filepath}: {e}")
+                except Exception as e:
+                    self._logger.error(f"Error saving {filepath}: {e}")
         
         return saved_files
     
     def save_lua_script_sequence(self,
-                                qr_data_list: List[Dict[str, Any]],
+                                qr_data_list: Iterable[Dict[str, Any]],
                                 output_dir: Union[str, Path],
-                                filename_prefix: str = "lua_script_") -> List[str]:
+                                filename_prefix: str = "lua_script_",
+                                total_fragments: Optional[int] = None) -> List[str]:
         """
         Save Lua script QR sequence with special numbering
         
         Args:
-            qr_data_list: List of QR data items with fragment info
+            qr_data_list: QR data items with fragment info; may be a lazy
+                iterator when total_fragments is given
             output_dir: Directory to save QR codes
             filename_prefix: Prefix for QR filenames
+            total_fragments: Number of items (default: len(qr_data_list))
             
         Returns:
             List of saved file paths
@@ -239,7 +500,19 @@ class QRImageSaver:
         output_path.mkdir(parents=True, exist_ok=True)
         
         saved_files = []
-        total_fragments = len(qr_data_list)
+        if total_fragments is None:
+            total_fragments = len(qr_data_list)
+        
+        # Add QR generation options for better readability. Frames use the
+        # fixed default mask (mask_pattern=0), so none runs a mask search. With
+        # segno each frame is one segno.make() call; the qrcode fallback reuses
+        # a per-thread QRCode from _get_qr(). Each frame still gets the smallest
+        # version that fits its own data
+        image_options = {
+            'size': 400,  # Larger QR for complex data
+            'border': 6,  # More border for better scanning
+            'error_correction': qrcode.constants.ERROR_CORRECT_L if _qr_available() else None
+        }
         
         for i, qr_item in enumerate(qr_data_list):
             fragment_num = i + 1
@@ -252,24 +525,32 @@ class QRImageSaver:
             filepath = output_path / filename
             
             try:
-                # Add QR generation options for better readability
-                image_options = {
-                    'size': 400,  # Larger QR for complex data
-                    'border': 6,  # More border for better scanning
-                    'error_correction': qrcode.constants.ERROR_CORRECT_L if QR_AVAILABLE else None
-                }
-                
                 qr_data = qr_item.get('qr_data', '')
                 title = qr_item.get('title', '')
                 description = qr_item.get('description', '')
                 
-                if self.save_qr_image(qr_data, filepath, title, description, **image_options):
-                    saved_files.append(str(filepath))
-                    self._logger.info(f"Saved QR {fragment_num}/{total_fragments}: {filepath}")
-                else:
-                    self._logger.error(f"Failed to save QR {fragment_num}/{total_fragments}: {filepath}")
+                # Encode in memory, then one write per file (directory created once above)
+                filepath.write_bytes(
+                    self.qr_png_bytes(qr_data, title, description, **image_options)
+                )
+                saved_files.append(str(filepath))
+                self._logger.info(f"Saved QR {fragment_num}/{total_fragments}: {filepath}")
                     
             except Exception as e:
                 self._logger.error(f"Error saving QR {fragment_num}/{total_fragments} to {filepath}: {e}")
         
-        return saved_files
\ No newline at end of file
+        return saved_files
+
+
+@functools.lru_cache(maxsize=None)
+def shared_image_saver() -> QRImageSaver:
+    """Process-wide QRImageSaver; savers hold no per-image state, so one serves all commands"""
+    return QRImageSaver()
+
+
+def _qr_png_job(qr_data: str, title: str, description: str, compress_level: int,
+                image_options: Dict[str, Any]) -> bytes:
+    """Batch worker; module-level so process pools can pickle it"""
+    return shared_image_saver().qr_png_bytes(
+        qr_data, title, description, compress_level, **image_options
+    )
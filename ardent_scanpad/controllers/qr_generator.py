@@ -13,17 +13,22 @@ Architecture:
 - INTERNAL: Delegates to new modular qr/ system
 """
 
+import functools
 import logging
-from typing import Optional, Dict, Any, Union, List
+import operator
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Any, Iterator, Union, List, Tuple
 from pathlib import Path
 
 # Import from new modular system
 from .qr.commands import (
-    LEDCommandBuilder, BuzzerCommandBuilder, DeviceCommandBuilder,
+    DIGIT_ACTIONS, LETTER_ACTIONS, LEDCommandBuilder, BuzzerCommandBuilder, DeviceCommandBuilder,
     KeyConfigCommandBuilder, FullConfigCommandBuilder, LuaCommandBuilder
 )
 from .qr.formats import QRFormatter
-from .qr.images import QRImageSaver
+from .qr.images import QRImageSaver, shared_image_saver, qr_dependencies_installed
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 # Keep constants import for compatibility
 from ..utils.constants import (
@@ -31,16 +36,42 @@ from ..utils.constants import (
     LEDs, BuzzerMelodies, DeviceOrientations, KeyboardLayouts
 )
 
-# For external PIL availability check
-try:
-    import qrcode
-    from PIL import Image, ImageDraw, ImageFont
-    QR_AVAILABLE = True
-except ImportError:
-    QR_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized fixed-input commands per controller
+_COMMAND_CACHE_SIZE = 256
+
+# raw_command_data(): create method -> builder providing it
+_RAW_COMMAND_BUILDERS = {
+    'create_led_on_command': '_led_builder',
+    'create_led_off_command': '_led_builder',
+    'create_all_leds_off_command': '_led_builder',
+    'create_buzzer_melody_command': '_buzzer_builder',
+    'create_orientation_command': '_device_builder',
+    'create_lua_clear_command': '_device_builder',
+    'create_lua_info_command': '_device_builder',
+    'create_key_config_command': '_key_builder',
+    'create_full_keyboard_config': '_full_builder',
+}
+
+
+def __getattr__(name: str):
+    """QR_AVAILABLE kept for compatibility, checked without importing qrcode/PIL"""
+    if name == 'QR_AVAILABLE':
+        return qr_dependencies_installed()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _command_metadata(command_data, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Full QRCommand metadata for a CommandData (module-level so commands stay picklable)"""
+    return {
+        'domain': command_data.domain,
+        'command_id': command_data.command_id,
+        'payload_hex': command_data.payload_hex,
+        **(metadata or {}),
+        **command_data.metadata
+    }
+
 
 class QRCommand:
     """
@@ -49,7 +80,14 @@ class QRCommand:
     Maintains exact same interface as before but uses modular backend
     """
     
-    def __init__(self, command_data: str, command_type: str, description: str, metadata: Dict[str, Any] = None):
+    # Batches create many commands - no per-instance __dict__
+    __slots__ = (
+        'command_data', 'command_type', 'description',
+        '_metadata', '_metadata_factory', '_qr_images', '_command_bytes'
+    )
+    
+    def __init__(self, command_data: str, command_type: str, description: str, metadata: Dict[str, Any] = None,
+                 _metadata_factory: Callable[[], Dict[str, Any]] = None):
         """
         Args:
             command_data: Raw command string (e.g., "$CMD:DEV:100201CMD$") 
@@ -60,45 +98,104 @@ class QRCommand:
         self.command_data = command_data
         self.command_type = command_type
         self.description = description
-        self.metadata = metadata or {}
-        self._qr_image = None
+        self._metadata = metadata or None
+        self._metadata_factory = _metadata_factory
+        self._command_bytes: Optional[Tuple[str, bytes]] = None
+        
+        # Rendered images by (size, border, error_correction, mask_pattern, add_title)
+        self._qr_images: Dict[tuple, 'Image.Image'] = {}
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional command information, built on first access"""
+        if self._metadata is None:
+            factory, self._metadata_factory = self._metadata_factory, None
+            self._metadata = factory() if factory is not None else {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = value
+        self._metadata_factory = None
+    
+    @property
+    def command_bytes(self) -> memoryview:
+        """Encoded command_data for transports, encoded once per command string"""
+        cached = self._command_bytes
+        if cached is None or cached[0] is not self.command_data:
+            cached = self._command_bytes = (self.command_data, self.command_data.encode('utf-8'))
+        return memoryview(cached[1])
+    
+    @property
+    def _image_saver(self) -> QRImageSaver:
+        """Image saver for compatibility methods (shared by all commands)"""
+        return shared_image_saver()
+    
+    def _rendered_image(self,
+                        size: int = 300,
+                        border: int = 4,
+                        error_correction=None,
+                        mask_pattern: Optional[int] = 0,
+                        add_title: Optional[bool] = None) -> 'Image.Image':
+        """Render once per option set; the returned image is shared, don't modify it"""
+        if add_title is None:
+            add_title = self.metadata.get('add_title', True)
         
-        # Create image saver for compatibility methods
-        self._image_saver = QRImageSaver()
+        key = (size, border, error_correction, mask_pattern, add_title)
+        qr_image = self._qr_images.get(key)
+        if qr_image is None:
+            # Use modular image generator (fails fast when dependencies are missing)
+            qr_image = self._qr_images[key] = self._image_saver._generator.generate_qr_image(
+                qr_data=self.command_data,
+                title=self.command_type,
+                description=self.description,
+                size=size,
+                border=border,
+                error_correction=error_correction,
+                add_title=add_title,
+                mask_pattern=mask_pattern
+            )
+        return qr_image
         
     def generate_qr_image(self, 
                          size: int = 300,
                          border: int = 4,
-                         error_correction=None) -> Optional['Image.Image']:
+                         error_correction=None,
+                         mask_pattern: Optional[int] = 0,
+                         add_title: Optional[bool] = None) -> 'Image.Image':
         """
         Generate QR code image for this command - PRESERVED API
+        
+        add_title defaults to metadata['add_title'] (True); app-embedded
+        callers that only display the code pass add_title=False to skip the banner.
+        
+        Raises:
+            RuntimeError: If qrcode/PIL are not installed
         """
-        if not QR_AVAILABLE:
-            logger.warning("qrcode library not available. Install with: pip install qrcode[pil]")
-            return None
-            
-        # Use modular image generator
-        return self._image_saver._generator.generate_qr_image(
-            qr_data=self.command_data,
-            title=self.command_type,
-            description=self.description,
-            size=size,
-            border=border,
-            error_correction=error_correction,
-            add_title=self.metadata.get('add_title', True)
-        )
+        return self._rendered_image(size, border, error_correction, mask_pattern, add_title).copy()
+    
+    def to_png_bytes(self, compress_level: int = 1, **kwargs) -> bytes:
+        """
+        PNG-encoded QR image for GUI/web callers, without a filesystem round-trip
+        
+        Title banner follows generate_qr_image(); pass add_title=False to skip it.
+        """
+        return self._image_saver.image_png_bytes(self._rendered_image(**kwargs), compress_level)
     
-    def save(self, filename: Union[str, Path], **kwargs) -> bool:
+    def save(self, filename: Union[str, Path], compress_level: int = 1, **kwargs) -> bool:
         """
         Save QR code as PNG image - PRESERVED API
+        
+        compress_level sets the PNG zlib level (default 1, fast). Reuses an
+        image already rendered with the same options.
         """
-        return self._image_saver.save_qr_image(
-            qr_data=self.command_data,
-            filename=filename,
-            title=self.command_type,
-            description=self.description,
-            **kwargs
-        )
+        kwargs.setdefault('add_title', True)
+        try:
+            qr_image = self._rendered_image(**kwargs)
+        except Exception as e:
+            logger.error(f"Failed to save QR code: {e}")
+            return False
+        return self._image_saver.save_image(qr_image, filename, compress_level)
     
     def __str__(self) -> str:
         return f"QRCommand({self.command_type}: {self.description})"
@@ -119,19 +216,48 @@ class QRGeneratorController:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._validate_dependencies()
         
-        # Initialize modular components
-        self._led_builder = LEDCommandBuilder()
-        self._buzzer_builder = BuzzerCommandBuilder()
-        self._device_builder = DeviceCommandBuilder()
-        self._key_builder = KeyConfigCommandBuilder()
-        self._full_builder = FullConfigCommandBuilder()
-        self._lua_builder = LuaCommandBuilder()
-        self._formatter = QRFormatter()
-        self._image_saver = QRImageSaver()
+        # Fixed-input command strings, keyed by (build method, args) - inputs fully
+        # determine output; each call still gets its own QRCommand
+        self._command_entry = functools.lru_cache(maxsize=_COMMAND_CACHE_SIZE)(self._build_command_entry)
+        
+    # Modular components, created on first use
+    
+    @functools.cached_property
+    def _led_builder(self) -> LEDCommandBuilder:
+        return LEDCommandBuilder()
+    
+    @functools.cached_property
+    def _buzzer_builder(self) -> BuzzerCommandBuilder:
+        return BuzzerCommandBuilder()
+    
+    @functools.cached_property
+    def _device_builder(self) -> DeviceCommandBuilder:
+        return DeviceCommandBuilder()
+    
+    @functools.cached_property
+    def _key_builder(self) -> KeyConfigCommandBuilder:
+        return KeyConfigCommandBuilder()
+    
+    @functools.cached_property
+    def _full_builder(self) -> FullConfigCommandBuilder:
+        return FullConfigCommandBuilder()
+    
+    @functools.cached_property
+    def _lua_builder(self) -> LuaCommandBuilder:
+        return LuaCommandBuilder()
+    
+    @functools.cached_property
+    def _formatter(self) -> QRFormatter:
+        return QRFormatter()
+    
+    @functools.cached_property
+    def _image_saver(self) -> QRImageSaver:
+        return shared_image_saver()
         
     def _validate_dependencies(self):
         """Check if required libraries are available"""
-        if not QR_AVAILABLE:
+        # Checked without importing qrcode/PIL - they load on first render
+        if not qr_dependencies_installed():
             self._logger.warning(
                 "QR code generation requires additional dependencies. "
                 "Install with: pip install qrcode[pil]"
@@ -139,18 +265,39 @@ class QRGeneratorController:
     
     def _create_qr_command(self, command_data, command_type: str, description: str, 
                           metadata: Dict[str, Any] = None) -> QRCommand:
-        """Create QRCommand from modular CommandData"""
+        """Create QRCommand from modular CommandData (metadata is merged on first access)"""
         formatted_data = self._formatter.format_command(command_data)
         
-        full_metadata = {
-            'domain': command_data.domain,
-            'command_id': command_data.command_id,
-            'payload_hex': command_data.payload.hex().upper(),
-            **(metadata or {}),
-            **command_data.metadata
-        }
+        return QRCommand(
+            formatted_data, command_type, description,
+            _metadata_factory=functools.partial(_command_metadata, command_data, metadata)
+        )
+    
+    def raw_command_data(self, create_method: str, *args, **kwargs) -> str:
+        """
+        Formatted QR string only - no QRCommand, metadata or image support
+        
+        Example: raw_command_data('create_led_on_command', 1) -> "$CMD:DEV:100101CMD$"
+        """
+        builder_name = _RAW_COMMAND_BUILDERS.get(create_method)
+        if builder_name is None:
+            raise ValueError(f"Unknown command method '{create_method}'. Must be one of: {list(_RAW_COMMAND_BUILDERS)}")
         
-        return QRCommand(formatted_data, command_type, description, full_metadata)
+        command_data = getattr(getattr(self, builder_name), create_method)(*args, **kwargs)
+        return self._formatter.format_command(command_data)
+    
+    def _build_command_entry(self, build_method: str, *args) -> Tuple[str, Any]:
+        """(formatted string, CommandData) for a dotted build method, e.g. '_led_builder.create_led_on_command'"""
+        command_data = operator.attrgetter(build_method)(self)(*args)
+        return self._formatter.format_command(command_data), command_data
+    
+    def _cached_command(self, build_method: str, *args) -> QRCommand:
+        """New QRCommand around the memoized command string for these inputs"""
+        formatted_data, command_data = self._command_entry(build_method, *args)
+        return QRCommand(
+            formatted_data, command_data.command_type, command_data.description,
+            _metadata_factory=functools.partial(_command_metadata, command_data, None)
+        )
     
     # ========================================
     # LED COMMANDS - PRESERVED API
@@ -158,18 +305,15 @@ class QRGeneratorController:
     
     def create_led_on_command(self, led_id: int) -> QRCommand:
         """Create LED ON command - PRESERVED API"""
-        command_data = self._led_builder.create_led_on_command(led_id)
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_led_builder.create_led_on_command', led_id)
     
     def create_led_off_command(self, led_id: int) -> QRCommand:
         """Create LED OFF command - PRESERVED API"""
-        command_data = self._led_builder.create_led_off_command(led_id)
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_led_builder.create_led_off_command', led_id)
     
     def create_all_leds_off_command(self) -> QRCommand:
         """Create command to turn all LEDs off - PRESERVED API"""
-        command_data = self._led_builder.create_all_leds_off_command()
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_led_builder.create_all_leds_off_command')
     
     # ========================================  
     # BUZZER COMMANDS - PRESERVED API
@@ -177,8 +321,7 @@ class QRGeneratorController:
     
     def create_buzzer_melody_command(self, melody_name: str) -> QRCommand:
         """Create buzzer melody command - PRESERVED API"""
-        command_data = self._buzzer_builder.create_buzzer_melody_command(melody_name)
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_buzzer_builder.create_buzzer_melody_command', melody_name)
     
     # ========================================
     # DEVICE SETTINGS COMMANDS - PRESERVED API
@@ -186,8 +329,7 @@ class QRGeneratorController:
     
     def create_orientation_command(self, orientation: int) -> QRCommand:
         """Create device orientation command - PRESERVED API"""
-        command_data = self._device_builder.create_orientation_command(orientation)
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_device_builder.create_orientation_command', orientation)
     
     # ========================================
     # LUA SCRIPT COMMANDS - PRESERVED API
@@ -195,13 +337,11 @@ class QRGeneratorController:
     
     def create_lua_clear_command(self) -> QRCommand:
         """Create command to clear/delete currently loaded Lua script - PRESERVED API"""
-        command_data = self._device_builder.create_lua_clear_command()
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_device_builder.create_lua_clear_command')
     
     def create_lua_info_command(self) -> QRCommand:
         """Create command to get Lua script information - PRESERVED API"""
-        command_data = self._device_builder.create_lua_info_command()
-        return self._create_qr_command(command_data, command_data.command_type, command_data.description)
+        return self._cached_command('_device_builder.create_lua_info_command')
     
     # ========================================
     # KEY CONFIGURATION COMMANDS - PRESERVED API
@@ -237,46 +377,43 @@ class QRGeneratorController:
     
     def create_standard_numpad_config(self) -> QRCommand:
         """Create a standard numeric keypad configuration - PRESERVED API"""
-        config = {}
-        for i in range(10):
-            config[i] = [self.create_text_action(str(i))]
-        return self.create_full_keyboard_config(config)
+        return self._cached_command('_numpad_config_data')
+    
+    def _numpad_config_data(self):
+        """Standard numpad layout CommandData"""
+        return self._full_builder.create_text_layout_config({i: str(i) for i in range(10)})
     
     def create_standard_alpha_config(self) -> QRCommand:
         """Create a standard alphabetic configuration - PRESERVED API"""
-        config = {}
-        for i in range(16):
-            letter = chr(ord('A') + i)
-            config[i] = [self.create_text_action(letter)]
-        return self.create_full_keyboard_config(config)
+        return self._cached_command('_alpha_config_data')
+    
+    def _alpha_config_data(self):
+        """Standard alpha layout CommandData"""
+        return self._full_builder.create_text_layout_config({i: chr(ord('A') + i) for i in range(16)})
     
     def create_demo_mixed_config(self) -> QRCommand:
         """Create a demonstration configuration with mixed action types - PRESERVED API"""
-        config = {
-            # Numbers 1-9
-            0: [self.create_text_action("1")],
-            1: [self.create_text_action("2")], 
-            2: [self.create_text_action("3")],
-            3: [self.create_text_action("4")],
-            4: [self.create_text_action("5")],
-            5: [self.create_text_action("6")],
-            6: [self.create_text_action("7")],
-            7: [self.create_text_action("8")],
-            8: [self.create_text_action("9")],
-            
-            # Letters A-D
-            9: [self.create_text_action("A")],
-            10: [self.create_text_action("B")],
-            11: [self.create_text_action("C")],
-            12: [self.create_text_action("D")],
-            
-            # Special keys with HID codes
-            13: [self.create_hid_action(HIDKeyCodes.LEFT_ARROW)],   # ←
-            14: [self.create_hid_action(HIDKeyCodes.RIGHT_ARROW)],  # →
-            15: [self.create_hid_action(HIDKeyCodes.ENTER)],        # ↵
-        }
+        return self._cached_command('_demo_mixed_config_data')
+    
+    def _demo_mixed_config_data(self):
+        """Demo mixed layout CommandData"""
+        return self._full_builder.create_full_keyboard_config(self._demo_mixed_template)
+    
+    @functools.cached_property
+    def _demo_mixed_template(self) -> Dict[int, list]:
+        """Key layout behind create_demo_mixed_config(), built once per controller"""
+        # Numbers 1-9 on keys 0-8
+        config = {i: [DIGIT_ACTIONS[i + 1]] for i in range(9)}
+        
+        # Letters A-D on keys 9-12
+        config.update({9 + i: [LETTER_ACTIONS[i]] for i in range(4)})
         
-        return self.create_full_keyboard_config(config)
+        # Special keys with HID codes
+        config[13] = [self.create_hid_action(HIDKeyCodes.LEFT_ARROW)]   # ←
+        config[14] = [self.create_hid_action(HIDKeyCodes.RIGHT_ARROW)]  # →
+        config[15] = [self.create_hid_action(HIDKeyCodes.ENTER)]        # ↵
+        
+        return config
     
     # ========================================
     # LUA SCRIPT DEPLOYMENT - PRESERVED API
@@ -285,18 +422,21 @@ class QRGeneratorController:
     def create_lua_script_qr(self, 
                            script_content: str,
                            max_qr_size: int = 1000,
-                           compression_level: int = 6) -> List[QRCommand]:
+                           compression_level: Optional[int] = None) -> List[QRCommand]:
         """Create QR codes for Lua script deployment - PRESERVED API"""
+        return list(self.create_lua_script_qr_iter(script_content, max_qr_size, compression_level))
+    
+    def create_lua_script_qr_iter(self,
+                                  script_content: str,
+                                  max_qr_size: int = 1000,
+                                  compression_level: Optional[int] = None) -> Iterator[QRCommand]:
+        """Yield the Lua deployment QR codes one at a time instead of building a list"""
         command_data_list = self._lua_builder.create_lua_script_commands(
             script_content, max_qr_size, compression_level
         )
         
-        qr_commands = []
         for command_data in command_data_list:
-            qr_command = self._create_qr_command(command_data, command_data.command_type, command_data.description)
-            qr_commands.append(qr_command)
-        
-        return qr_commands
+            yield self._create_qr_command(command_data, command_data.command_type, command_data.description)
     
     def create_lua_script_from_file(self, 
                                   script_path: Union[str, Path],
@@ -318,8 +458,9 @@ class QRGeneratorController:
     def save_multiple_qr_codes(self, commands: List[QRCommand], 
                               output_dir: Union[str, Path],
                               filename_prefix: str = "qr_",
+                              max_workers: Optional[int] = None,
                               **qr_kwargs) -> List[str]:
-        """Save multiple QR codes to files - PRESERVED API"""
+        """Save multiple QR codes to files in parallel (max_workers defaults to CPU count) - PRESERVED API"""
         qr_data_list = []
         
         for command in commands:
@@ -330,7 +471,7 @@ class QRGeneratorController:
             })
         
         return self._image_saver.save_multiple_qr_images(
-            qr_data_list, output_dir, filename_prefix, **qr_kwargs
+            qr_data_list, output_dir, filename_prefix, max_workers=max_workers, **qr_kwargs
         )
     
     def save_lua_script_qr_sequence(self,
@@ -339,20 +480,20 @@ class QRGeneratorController:
                                    filename_prefix: str = "lua_script_",
                                    **kwargs) -> List[str]:
         """Generate and save complete QR sequence for a Lua script - PRESERVED API"""
-        # Generate QR commands
-        qr_commands = self.create_lua_script_qr(script_content, **kwargs)
+        command_data_list = self._lua_builder.create_lua_script_commands(script_content, **kwargs)
         
-        # Prepare data for specialized Lua saver
-        qr_data_list = []
-        for cmd in qr_commands:
-            qr_data_list.append({
-                'qr_data': cmd.command_data,
-                'title': cmd.command_type,
-                'description': cmd.description
-            })
+        # Single pass: each fragment is formatted as the saver reaches it
+        qr_items = (
+            {
+                'qr_data': self._formatter.format_command(command_data),
+                'title': command_data.command_type,
+                'description': command_data.description
+            }
+            for command_data in command_data_list
+        )
         
         return self._image_saver.save_lua_script_sequence(
-            qr_data_list, output_dir, filename_prefix
+            qr_items, output_dir, filename_prefix, total_fragments=len(command_data_list)
         )
     
     # ========================================
@@ -361,10 +502,16 @@ class QRGeneratorController:
     
     def create_quick_text_key(self, key_id: int, text: str) -> QRCommand:
         """Quick method to create a single-text-action key - PRESERVED API"""
-        action = self.create_text_action(text)
-        return self.create_key_config_command(key_id, [action])
+        return self._cached_command('_quick_text_key_data', key_id, text)
+    
+    def _quick_text_key_data(self, key_id: int, text: str):
+        """Single-text-action key CommandData"""
+        return self._key_builder.create_key_config_command(key_id, [self.create_text_action(text)])
     
     def create_quick_hid_key(self, key_id: int, keycode: int, modifier: int = 0) -> QRCommand:
         """Quick method to create a single-HID-action key - PRESERVED API"""
-        action = self.create_hid_action(keycode, modifier)
-        return self.create_key_config_command(key_id, [action])
\ No newline at end of file
+        return self._cached_command('_quick_hid_key_data', key_id, keycode, modifier)
+    
+    def _quick_hid_key_data(self, key_id: int, keycode: int, modifier: int):
+        """Single-HID-action key CommandData"""
+        return self._key_builder.create_key_config_command(key_id, [self.create_hid_action(keycode, modifier)])
\ No newline at end of file
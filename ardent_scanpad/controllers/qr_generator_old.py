@@ -107,11 +107,11 @@ class QRCommand:
         title_height = 60
         total_height = qr_size + title_height
         
-        # Create new image with title area
-        final_img = Image.new('RGB', (qr_size, total_height), 'white')
+        # Create new image with title area (grayscale - content is monochrome)
+        final_img = Image.new('L', (qr_size, total_height), 255)
         
         # Paste QR code
-        final_img.paste(qr_img, (0, title_height))
+        final_img.paste(qr_img.convert('L'), (0, title_height))
         
         # Add text
         draw = ImageDraw.Draw(final_img)
@@ -130,14 +130,14 @@ class QRCommand:
         title_bbox = draw.textbbox((0, 0), title_text, font=font_title)
         title_width = title_bbox[2] - title_bbox[0]
         title_x = (qr_size - title_width) // 2
-        draw.text((title_x, 5), title_text, fill='black', font=font_title)
+        draw.text((title_x, 5), title_text, fill=0, font=font_title)
         
         # Draw description  
         desc_text = self.description[:50] + ("..." if len(self.description) > 50 else "")
         desc_bbox = draw.textbbox((0, 0), desc_text, font=font_desc)
         desc_width = desc_bbox[2] - desc_bbox[0]
         desc_x = (qr_size - desc_width) // 2
-        draw.text((desc_x, 25), desc_text, fill='gray', font=font_desc)
+        draw.text((desc_x, 25), desc_text, fill=128, font=font_desc)
         
         return final_img
     
@@ -160,7 +160,7 @@ class QRCommand:
                 logger.error("Cannot generate QR image - qrcode library not available")
                 return False
                 
-            self._qr_image.save(filename, 'PNG')
+            self._qr_image.save(filename, 'PNG', compress_level=1, optimize=False)
             logger.info(f"QR code saved to {filename}")
             return True
             
@@ -6,11 +6,17 @@ error handling, and async context manager support.
 """
 
 import asyncio
+import functools
 import logging
+import os
 import platform
-from typing import Optional, Dict, Any, Callable
+import random
+from typing import Optional, Dict, Any, Callable, Iterable, Union
+from pathlib import Path
 from bleak import BleakClient, BleakScanner
 from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
 
 from .exceptions import ConnectionError, DeviceNotFoundError, TimeoutError, NotificationError
 
@@ -20,6 +26,11 @@ logger = logging.getLogger(__name__)
 DEVICE_NAME = "aRdent ScanPad"
 SERVICE_UUID = "f0debc9a-7856-3412-f0de-bc9a78560000"
 
+# Resolved once - platform.system() costs a uname() call each time
+_PLATFORM = platform.system()
+_IS_LINUX = _PLATFORM == "Linux"
+_SERVICE_UUID_LOWER = SERVICE_UUID.lower()
+
 # BLE Characteristics
 CHAR_UUIDS = {
     # Key/Button Configuration
@@ -31,6 +42,78 @@ CHAR_UUIDS = {
     'device_response': "f0debc9a-7856-3412-f0de-bc9a78560011",   # Read/Notify device responses
 }
 
+# Response characteristic UUIDs, normalized once for notification routing
+_DEVICE_RESP_UUID = CHAR_UUIDS['device_response'].lower()
+_CONFIG_RESP_UUID = CHAR_UUIDS['config_response'].lower()
+
+# Command characteristic -> characteristic its responses are notified on
+_RESPONSE_UUIDS = {
+    'device_commands': _DEVICE_RESP_UUID,  # LED, Buzzer, Device settings, OTA
+    'config_commands': _CONFIG_RESP_UUID,  # Key/Button configuration
+}
+
+# Auto-reconnect backoff (seconds): base * 2^(attempt-1), capped, plus random jitter
+RECONNECT_BASE_DELAY = 1.5
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_JITTER = 1.0
+
+# Unconsumed notifications kept per response domain
+RESPONSE_QUEUE_SIZE = 256
+
+
+class _ResponseQueue(asyncio.Queue):
+    """Bounded response queue that drops its oldest entry when full"""
+    
+    def __init__(self, maxsize: int = RESPONSE_QUEUE_SIZE):
+        super().__init__(maxsize)
+    
+    def put_response(self, data: Union[bytes, bytearray]) -> None:
+        """Queue a response without ever blocking the notification path"""
+        # Every notification is kept - identical commands get identical answers
+        if self.full():
+            self.get_nowait()
+        self.put_nowait(data)
+
+# Connect attempt budget for the remembered address before falling back to a scan
+CACHED_ADDRESS_TIMEOUT = 5.0
+
+
+def _cache_path() -> Path:
+    """File holding the last connected device address"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'ardent_scanpad' / 'last_device'
+
+
+def _load_cached_address() -> Optional[str]:
+    """Last connected device address, or None"""
+    try:
+        return _cache_path().read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+
+def _save_cached_address(address: str) -> None:
+    """Remember the connected device address (best effort)"""
+    if _load_cached_address() == address:
+        return
+    try:
+        path = _cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(address, encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not cache device address: {e}")
+
+
+def _is_scanpad(device: BLEDevice, advertisement_data: AdvertisementData) -> bool:
+    """Scanner filter: matches by (partial) device name or advertised service UUID"""
+    name = device.name or advertisement_data.local_name
+    if name and DEVICE_NAME in name:
+        return True
+    
+    # Some platforms (macOS) may report no name; fall back to the service UUID.
+    # bleak already normalizes advertised UUIDs to lower case on every backend
+    return _SERVICE_UUID_LOWER in advertisement_data.service_uuids
+
 
 class BLEConnection:
     """
@@ -44,13 +127,28 @@ class BLEConnection:
     - Notification management
     """
     
-    def __init__(self, auto_reconnect: bool = True, timeout: float = 30.0):
+    # Read on every write and notification - keep attribute access off a __dict__
+    __slots__ = (
+        'client', 'address', 'characteristics', 'auto_reconnect', 'timeout', 'remember_device',
+        'use_gatt_cache',
+        '_notification_handlers', '_connected', '_reconnect_task', '_write_fns',
+        '_uuid_handlers', '_notification_queue', '_notification_worker',
+        '_response_queues',
+    )
+    
+    def __init__(self, auto_reconnect: bool = True, timeout: float = 30.0, remember_device: bool = False,
+                 use_gatt_cache: bool = False):
         """
         Initialize BLE connection manager
         
         Args:
             auto_reconnect: Enable automatic reconnection on disconnection
             timeout: Default timeout for operations in seconds
+            remember_device: Try the last connected device before scanning
+                (opt-in: writes the address to the user cache directory)
+            use_gatt_cache: Linux/BlueZ only - reuse bleak's cached GATT services
+                instead of rediscovering them on each connect (opt-in: after a
+                firmware update changes the GATT table the cache goes stale)
         """
         self.client: Optional[BleakClient] = None
         self.address: Optional[str] = None
@@ -58,12 +156,24 @@ class BLEConnection:
         self._notification_handlers: Dict[str, Callable] = {}
         self.auto_reconnect = auto_reconnect
         self.timeout = timeout
+        self.remember_device = remember_device
+        self.use_gatt_cache = use_gatt_cache
         self._connected = False
         self._reconnect_task: Optional[asyncio.Task] = None
         
+        # Characteristic name -> write_gatt_char pre-bound to that characteristic
+        self._write_fns: Dict[str, Callable] = {}
+        
+        # Notification dispatch: characteristic UUID -> handler, run by a worker task
+        self._uuid_handlers: Dict[str, Callable] = {}
+        self._notification_queue: Optional[asyncio.Queue] = None
+        self._notification_worker: Optional[asyncio.Task] = None
+        
         # Response handling for controllers - CLEAR DOMAIN SEPARATION
-        self._received_device_responses = []  # Device domain responses (LED/Buzzer/Settings/OTA)
-        self._received_config_responses = []  # Config domain responses (Keys/Buttons)
+        # Bounded queues: consumers await responses instead of polling, and a
+        # burst nobody drains drops the oldest entries instead of growing
+        self._response_queues: Dict[str, _ResponseQueue] = {}
+        self._reset_response_queues()
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -85,73 +195,25 @@ class BLEConnection:
             Device address/identifier (UUID on macOS, MAC address on Windows)
             
         Raises:
-            DeviceNotFoundError: If device not found
-            TimeoutError: If scan times out
+            DeviceNotFoundError: If no device is seen before the timeout
+            ConnectionError: If the scan itself fails
         """
         scan_timeout = timeout or self.timeout
-        is_macos = platform.system() == "Darwin"
         
-        logger.info(f"🔍 Scanning for {DEVICE_NAME} (timeout: {scan_timeout}s, platform: {platform.system()})")
+        logger.info(f"🔍 Scanning for {DEVICE_NAME} (timeout: {scan_timeout}s, platform: {_PLATFORM})")
         
         try:
-            # Phase 1: Fast scanning with early exit (1-3 seconds typical)
-            logger.debug("Phase 1: Fast device discovery with early exit")
-            
-            # Use find_device_by_name for immediate response when device is available
-            device = await asyncio.wait_for(
-                BleakScanner.find_device_by_name(DEVICE_NAME, timeout=min(scan_timeout, 5.0)),
-                timeout=min(scan_timeout, 5.0) + 1.0
-            )
-            
-            if device:
-                logger.info(f"✅ Found device (fast): {device.name} ({device.address})")
-                return device.address
-                
-        except (asyncio.TimeoutError, Exception) as e:
-            logger.debug(f"Phase 1 fast scan completed, no immediate match: {e}")
-            
-        try:
-            # Phase 2: Comprehensive scan with partial name matching
-            logger.debug("Phase 2: Comprehensive device scan")
-            
-            # Adjust timeout for remaining time
-            remaining_timeout = max(scan_timeout - 5.0, 2.0)
-            
-            devices = await asyncio.wait_for(
-                BleakScanner.discover(timeout=remaining_timeout),
-                timeout=remaining_timeout + 2.0
-            )
-            
-            # Primary search: exact name match
-            for device in devices:
-                if device.name == DEVICE_NAME:
-                    logger.info(f"✅ Found device: {device.name} ({device.address})")
-                    return device.address
-                    
-            # Secondary search: partial name match (robust fallback)
-            for device in devices:
-                if device.name and "aRdent ScanPad" in device.name:
-                    logger.info(f"✅ Found device (partial): {device.name} ({device.address})")
-                    return device.address
-            
-            # Platform-specific additional searches
-            if is_macos:
-                # On macOS, also try searching by service UUID
-                logger.debug("macOS: Searching by service UUID")
-                for device in devices:
-                    # Check if device advertises our service UUID
-                    if hasattr(device, 'metadata') and device.metadata:
-                        service_uuids = device.metadata.get('uuids', [])
-                        if SERVICE_UUID.lower() in [uuid.lower() for uuid in service_uuids]:
-                            logger.info(f"✅ Found device by service UUID: {device.address}")
-                            return device.address
-                            
-            raise DeviceNotFoundError(f"No {DEVICE_NAME} device found in {len(devices)} scanned devices")
-            
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"Device scan timed out after {scan_timeout}s")
+            # Single scan that returns on the first matching advertisement
+            # instead of waiting out a fixed scan window
+            device = await BleakScanner.find_device_by_filter(_is_scanpad, timeout=scan_timeout)
         except Exception as e:
             raise ConnectionError(f"Error during device discovery: {e}")
+        
+        if device is None:
+            raise DeviceNotFoundError(f"No {DEVICE_NAME} device found within {scan_timeout}s")
+        
+        logger.info(f"✅ Found device: {device.name} ({device.address})")
+        return device.address
     
     async def connect(self, address: Optional[str] = None, timeout: Optional[float] = None) -> None:
         """
@@ -168,24 +230,46 @@ class BLEConnection:
         """
         connect_timeout = timeout or self.timeout
         
-        # Find device if address not provided
+        # Find device if address not provided - the last connected device
+        # usually still answers at its address, which skips the scan entirely
         if not address:
-            address = await self.find_device(connect_timeout / 2)
+            cached_address = None
+            if self.remember_device:
+                # File I/O off the event loop
+                loop = asyncio.get_running_loop()
+                cached_address = await loop.run_in_executor(None, _load_cached_address)
+            if cached_address:
+                try:
+                    await self._connect_address(cached_address, min(connect_timeout, CACHED_ADDRESS_TIMEOUT))
+                    return
+                except (ConnectionError, TimeoutError) as e:
+                    logger.debug(f"Last known device {cached_address} not reachable, scanning: {e}")
             
+            address = await self.find_device(connect_timeout / 2)
+        
+        await self._connect_address(address, connect_timeout)
+    
+    async def _connect_address(self, address: str, connect_timeout: float) -> None:
+        """Connect to a known address and discover characteristics"""
         self.address = address
         logger.info(f"🔌 Connecting to {address}")
         
         try:
             # Create BleakClient with disconnect callback in constructor (modern Bleak API)
             disconnect_callback = self._on_disconnect if self.auto_reconnect else None
-            self.client = BleakClient(address, disconnected_callback=disconnect_callback)
-            
-            # Connect with timeout
-            await asyncio.wait_for(
-                self.client.connect(),
-                timeout=connect_timeout
+            self.client = BleakClient(
+                address, disconnected_callback=disconnect_callback, timeout=connect_timeout
             )
             
+            # BlueZ: optionally reuse bleak's cached GATT services for a known
+            # address instead of re-walking D-Bus on every (re)connect
+            use_cache = self.use_gatt_cache and _IS_LINUX
+            connect_kwargs = {'dangerous_use_bleak_cache': True} if use_cache else {}
+            
+            # Connect - bleak enforces the constructor timeout itself (raising
+            # asyncio.TimeoutError), so no second wait_for timer is needed
+            await self.client.connect(**connect_kwargs)
+            
             if not self.client.is_connected:
                 raise ConnectionError("Client reports not connected after connection attempt")
                 
@@ -196,6 +280,7 @@ class BLEConnection:
             await self._discover_characteristics()
                 
         except asyncio.TimeoutError:
+            self.client = None
             raise TimeoutError(f"Connection timed out after {connect_timeout}s")
         except Exception as e:
             self._connected = False
@@ -206,12 +291,17 @@ class BLEConnection:
                     pass
                 self.client = None
             raise ConnectionError(f"Failed to connect to device: {e}")
+        
+        if self.remember_device:
+            await asyncio.get_running_loop().run_in_executor(None, _save_cached_address, address)
     
     async def disconnect(self) -> None:
         """Disconnect from device"""
         if self._reconnect_task:
             self._reconnect_task.cancel()
             self._reconnect_task = None
+        
+        self._stop_notification_worker()
             
         self._connected = False
         
@@ -225,6 +315,8 @@ class BLEConnection:
         self.client = None
         self.characteristics.clear()
         self._notification_handlers.clear()
+        self._uuid_handlers.clear()
+        self._write_fns.clear()
         logger.info("✅ Disconnected from device")
     
     async def _discover_characteristics(self) -> None:
@@ -234,20 +326,24 @@ class BLEConnection:
             
         logger.debug("🔍 Discovering characteristics (optimized)")
         
-        # Optimized: use get_characteristic() directly instead of double loop
-        services = self.client.services  # Instantaneous after connect()
+        # services.get_characteristic(uuid) scans every characteristic per
+        # call - index them by UUID once, then resolve each name in O(1)
+        by_uuid = {char.uuid: char for char in self.client.services.characteristics.values()}
         
         for name, uuid in CHAR_UUIDS.items():
-            try:
-                char = services.get_characteristic(uuid)
-                if char:
-                    self.characteristics[name] = char
-                    logger.debug(f"📡 Found characteristic: {name} ({uuid})")
-                else:
-                    logger.warning(f"⚠️ Characteristic not found: {name} ({uuid})")
-                    
-            except Exception as e:
-                logger.warning(f"Error discovering characteristic {name}: {e}")
+            char = by_uuid.get(uuid)
+            if char:
+                self.characteristics[name] = char
+                logger.debug(f"📡 Found characteristic: {name} ({uuid})")
+            else:
+                logger.warning(f"⚠️ Characteristic not found: {name} ({uuid})")
+        
+        # Pass bleak the characteristic object itself so writes skip its
+        # specifier resolution
+        self._write_fns = {
+            name: functools.partial(self.client.write_gatt_char, char)
+            for name, char in self.characteristics.items()
+        }
         
         logger.info(f"✅ Discovered {len(self.characteristics)} characteristics (optimized)")
     
@@ -260,16 +356,26 @@ class BLEConnection:
             logger.info("🔄 Starting auto-reconnection")
             self._reconnect_task = asyncio.create_task(self._auto_reconnect())
     
-    async def _auto_reconnect(self, max_attempts: int = 5) -> None:
-        """Auto-reconnection loop"""
+    async def _auto_reconnect(self, max_attempts: int = 5, max_total_time: float = 120.0) -> None:
+        """Auto-reconnection loop (exponential backoff with jitter, bounded by max_total_time)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_total_time
         attempt = 1
         
         while attempt <= max_attempts and not self._connected:
+            # Exponential backoff; the random jitter keeps retries from staying
+            # phase-locked to the device's advertising interval
+            delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** (attempt - 1))
+            delay += random.uniform(0, RECONNECT_JITTER)
+            remaining = deadline - loop.time() - delay
+            if remaining <= 0:
+                break
+            
             try:
                 logger.info(f"🔄 Reconnection attempt {attempt}/{max_attempts}")
-                await asyncio.sleep(2.0 * attempt)  # Exponential backoff
+                await asyncio.sleep(delay)
                 
-                await self.connect(self.address, timeout=10.0)
+                await self.connect(self.address, timeout=min(10.0, remaining))
                 
                 if self._connected:
                     logger.info("✅ Auto-reconnection successful")
@@ -280,7 +386,7 @@ class BLEConnection:
                 
             attempt += 1
         
-        logger.error(f"❌ Auto-reconnection failed after {max_attempts} attempts")
+        logger.error(f"❌ Auto-reconnection failed after {attempt - 1} attempts")
         self._reconnect_task = None
     
     async def setup_notifications(self, handlers: Dict[str, Callable] = None) -> None:
@@ -298,42 +404,97 @@ class BLEConnection:
             
         handlers = handlers or {}
         
+        # Fresh response queues when notifications are setup (created here,
+        # inside the running loop, so they bind to the right event loop)
+        self._reset_response_queues()
+        
+        # Handlers run on a worker task; the BLE callback only enqueues. Queue
+        # and worker are always replaced together - a worker left over from a
+        # dropped connection would otherwise wait forever on the old queue
+        self._stop_notification_worker()
+        self._notification_queue = asyncio.Queue()
+        self._notification_worker = asyncio.create_task(
+            self._run_notification_worker(self._notification_queue)
+        )
+        
         # Setup notifications for response characteristics
-        response_chars = ['config_response', 'device_response']
+        response_chars = [
+            char_name for char_name in ('config_response', 'device_response')
+            if char_name in self.characteristics
+        ]
+        char_handlers = {
+            char_name: handlers.get(char_name, self._default_notification_handler)
+            for char_name in response_chars
+        }
+        for char_name, handler in char_handlers.items():
+            self._uuid_handlers[self.characteristics[char_name].uuid] = handler
         
-        for char_name in response_chars:
-            if char_name in self.characteristics:
-                try:
-                    handler = handlers.get(char_name, self._default_notification_handler)
-                    await self.client.start_notify(self.characteristics[char_name], handler)
-                    self._notification_handlers[char_name] = handler
-                    logger.debug(f"📬 Notifications enabled for {char_name}")
-                    
-                except Exception as e:
-                    raise NotificationError(f"Failed to setup notifications for {char_name}: {e}")
+        # Each start_notify is a CCCD write round-trip - overlap them
+        results = await asyncio.gather(
+            *(self.client.start_notify(self.characteristics[char_name], self._enqueue_notification)
+              for char_name in response_chars),
+            return_exceptions=True
+        )
         
-        logger.info("✅ BLE notifications configured")
+        for char_name, result in zip(response_chars, results):
+            if isinstance(result, Exception):
+                raise NotificationError(f"Failed to setup notifications for {char_name}: {result}")
+            self._notification_handlers[char_name] = char_handlers[char_name]
+            logger.debug(f"📬 Notifications enabled for {char_name}")
         
-        # Clear response queues when notifications are setup
-        self._received_device_responses = []
-        self._received_config_responses = []
+        logger.info("✅ BLE notifications configured")
+    
+    def _enqueue_notification(self, sender: BleakGATTCharacteristic, data: bytearray) -> None:
+        """BLE notification callback - hand off to the worker and return immediately"""
+        # bleak passes a fresh bytearray per notification, no copy needed
+        self._notification_queue.put_nowait((sender, data))
+    
+    def _stop_notification_worker(self) -> None:
+        """Cancel the notification worker task, if any"""
+        if self._notification_worker:
+            self._notification_worker.cancel()
+            self._notification_worker = None
+    
+    async def _run_notification_worker(self, queue: asyncio.Queue) -> None:
+        """Run notification handlers off the BLE receive path"""
+        while True:
+            sender, data = await queue.get()
+            handler = self._uuid_handlers.get(sender.uuid)
+            if handler is None:
+                continue
+            try:
+                handler(sender, data)
+            except Exception as e:
+                logger.error(f"Notification handler failed for {sender.uuid}: {e}")
     
     def _default_notification_handler(self, sender: BleakGATTCharacteristic, data: bytearray) -> None:
         """Default notification handler - handles responses like test_scripts_v2"""
-        logger.debug(f"📬 Notification from {sender.uuid}: {data.hex()}")
-        
-        # Store responses based on characteristic like test_scripts_v2 ScanPadController
-        char_uuid = str(sender.uuid).lower()
-        
-        # Device domain responses (LED, Buzzer, Device settings, OTA)
-        if char_uuid == CHAR_UUIDS['device_response'].lower():
-            self._received_device_responses.append(bytes(data))
-            logger.debug(f"📥 Device response stored: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📬 Notification from %s: %s", sender.uuid, data.hex())
         
-        # Config domain responses (Key/Button configuration)
-        elif char_uuid == CHAR_UUIDS['config_response'].lower():
-            self._received_config_responses.append(bytes(data))
-            logger.debug(f"📥 Config response stored: {data.hex()}")
+        # Store responses based on characteristic like test_scripts_v2 ScanPadController.
+        # bleak hands over a fresh bytearray per notification, so it is stored as-is
+        queue = self._response_queues.get(sender.uuid)
+        if queue is not None:
+            queue.put_response(data)
+    
+    def _reset_response_queues(self) -> None:
+        """Create one empty response queue per response characteristic"""
+        # Keyed by response UUID: bleak reports characteristic UUIDs normalized
+        # to lower case, so sender.uuid is matched as-is per notification
+        self._response_queues = {uuid: _ResponseQueue() for uuid in _RESPONSE_UUIDS.values()}
+    
+    def response_queue(self, command_char: str) -> asyncio.Queue:
+        """Response queue answering commands written to command_char"""
+        return self._response_queues[_RESPONSE_UUIDS[command_char]]
+    
+    async def next_device_response(self) -> bytes:
+        """Wait for the next device domain response (LED/Buzzer/Settings/OTA)"""
+        return await self._response_queues[_DEVICE_RESP_UUID].get()
+    
+    async def next_config_response(self) -> bytes:
+        """Wait for the next config domain response (Keys/Buttons)"""
+        return await self._response_queues[_CONFIG_RESP_UUID].get()
     
     @property
     def is_connected(self) -> bool:
@@ -360,20 +521,58 @@ class BLEConnection:
             logger.error("❌ Not connected to device")
             return False
             
-        char = self.characteristics.get(char_name)
-        if not char:
+        write = self._write_fns.get(char_name)
+        if not write:
             logger.error(f"❌ Characteristic '{char_name}' not available")
             return False
             
         try:
-            await self.client.write_gatt_char(char, data, response=response)
-            logger.debug(f"✅ Written to {char_name}: {data.hex()}")
+            await write(data, response=response)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Written to %s: %s", char_name, data.hex())
             return True
             
         except Exception as e:
             logger.error(f"❌ Write failed to {char_name}: {e}")
             return False
     
+    async def write_chars_batch(self, char_name: str, payloads: Iterable[bytes], response: bool = False) -> bool:
+        """
+        Write several payloads to one characteristic, in order
+        
+        Connection state and the characteristic are resolved once for the
+        whole batch, and with response=False the writes go out back-to-back
+        without a GATT round-trip each. Payloads are written sequentially:
+        the device applies them in order, so they are never reordered.
+        
+        Args:
+            char_name: Characteristic name
+            payloads: Data packets to write
+            response: Whether to wait for a response to each write
+            
+        Returns:
+            True if every write succeeded, False otherwise
+        """
+        if not self.is_connected:
+            logger.error("❌ Not connected to device")
+            return False
+            
+        write = self._write_fns.get(char_name)
+        if not write:
+            logger.error(f"❌ Characteristic '{char_name}' not available")
+            return False
+        
+        written = 0
+        try:
+            for data in payloads:
+                await write(data, response=response)
+                written += 1
+            logger.debug("✅ Written %d packets to %s", written, char_name)
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Batch write failed to {char_name} after {written} packets: {e}")
+            return False
     
     async def read_characteristic(self, char_name: str) -> bytes:
         """
@@ -398,7 +597,8 @@ class BLEConnection:
             
         try:
             data = await self.client.read_gatt_char(char)
-            logger.debug(f"📥 Read from {char_name}: {data.hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📥 Read from %s: %s", char_name, data.hex())
             return data
             
         except Exception as e:
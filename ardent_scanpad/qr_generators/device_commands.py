@@ -7,14 +7,49 @@ Hybrid API for device commands:
 - Both use the same modular QR backend
 """
 
+import binascii
+import functools
 import logging
 import struct
-from typing import Dict, Any, List, Union, Optional, Callable
+from typing import Dict, Any, List, Union, Optional, Callable, Tuple
 from pathlib import Path
 
 from .utils.json_support import JSONValidator
-from .utils.qr_core import QRCore, QRCommand
+from .utils.qr_core import QRCore, QRCommand, CommandData
 from ..controllers.base import Commands
+from ..controllers.qr_generator import QRCommand as LegacyQRCommand
+from ..utils.command_parser import CommandParser
+
+# Upper bound on memoized command binaries / simple-command QR codes per generator
+_BINARY_CACHE_SIZE = 256
+_SIMPLE_COMMAND_CACHE_SIZE = 256
+
+# Precompiled payload layouts for the manually packed commands
+_LED_BLINK_PAYLOAD = struct.Struct('<Bf')  # led_id, frequency
+_UINT16_PAIR_PAYLOAD = struct.Struct('<HH')
+_UINT16_PAYLOAD = struct.Struct('<H')
+_UINT32_PAYLOAD = struct.Struct('<I')
+
+# Opcode-only power commands, encoded once at import
+_SHUTDOWN_COMMAND = (Commands.SYSTEM_SHUTDOWN, b'')
+_RESTART_COMMAND = (Commands.SYSTEM_RESTART, b'')
+
+# Commands whose builders ignore parameters - their encoding is a constant
+_PARAMETERLESS_COMMANDS = (
+    ('led_control', 'all_leds_off'),
+    ('power_management', 'shutdown'),
+    ('power_management', 'restart'),
+    ('lua_management', 'clear_script'),
+    ('lua_management', 'get_script_info'),
+)
+
+
+def _freeze_parameters(parameters: Dict[str, Any]) -> tuple:
+    """Hashable form of a parameters dict (raises TypeError for unhashable values)"""
+    # The value type is part of the key so e.g. 1 and 1.0 stay distinct
+    key = tuple(sorted((name, type(value), value) for name, value in parameters.items()))
+    hash(key)
+    return key
 
 
 class DeviceCommandGenerator:
@@ -24,13 +59,43 @@ class DeviceCommandGenerator:
     Supports both JSON-driven and traditional API approaches for device commands
     """
     
-    def __init__(self):
+    def __init__(self, cache_validation: bool = False):
+        """
+        Args:
+            cache_validation: Opt-in - skip re-validating a JSON dict that is
+                passed to from_json again (same object). Only safe when callers
+                never modify a dict between calls.
+        """
         self._qr_core = QRCore()
         self._logger = logging.getLogger(self.__class__.__name__)
         
+        # Last dict that passed validation - held so its id cannot be reused
+        self._cache_validation = cache_validation
+        self._last_validated: Optional[Dict[str, Any]] = None
+        
+        # QRCore builder methods used by the _build_* methods, bound once
+        led_builder = self._qr_core._led_builder
+        device_builder = self._qr_core._device_builder
+        self._create_led_on = led_builder.create_led_on_command
+        self._create_led_off = led_builder.create_led_off_command
+        self._create_all_leds_off = led_builder.create_all_leds_off_command
+        self._create_buzzer_melody = self._qr_core._buzzer_builder.create_buzzer_melody_command
+        self._create_orientation = device_builder.create_orientation_command
+        self._create_lua_clear = device_builder.create_lua_clear_command
+        self._create_lua_info = device_builder.create_lua_info_command
+        
         # Command mapping table for easy maintenance
         # Format: (domain, action) -> builder function
         self._command_builders = self._init_command_builders()
+        
+        # Built binaries by (domain, action, parameters) - builders are pure
+        self._binary_cache: Dict[tuple, Tuple[int, bytes]] = {}
+        self._simple_command_entry = functools.lru_cache(
+            maxsize=_SIMPLE_COMMAND_CACHE_SIZE
+        )(self._build_simple_command_entry)
+        self._constant_binaries: Dict[tuple, Tuple[int, bytes]] = {
+            key: self._command_builders[key]({}) for key in _PARAMETERLESS_COMMANDS
+        }
     
     # ===== JSON API =====
     
@@ -71,9 +136,16 @@ class DeviceCommandGenerator:
             else:
                 raise ValueError("Unable to auto-detect command format. Add 'type' field or use standard structure.")
         
-        # Validate JSON structure
-        JSONValidator.validate_device_json(json_data)
+        # Validate JSON structure (once per dict object when caching)
+        if json_data is not self._last_validated:
+            JSONValidator.validate_device_json(json_data)
+            if self._cache_validation:
+                self._last_validated = json_data
         
+        return self._dispatch_json(json_data)
+    
+    def _dispatch_json(self, json_data: Dict[str, Any]) -> List[QRCommand]:
+        """Generate QR codes from already validated device command JSON"""
         # Handle different command formats
         if json_data.get('type') == 'single_command':
             # Single command format
@@ -113,16 +185,37 @@ class DeviceCommandGenerator:
         """
         if parameters is None:
             parameters = {}
-            
-        # Build minimal JSON structure
-        json_data = {
+        
+        # GUIs re-emit the same command often - reuse the encoded command
+        try:
+            frozen_parameters = _freeze_parameters(parameters)
+        except TypeError:
+            # Unhashable parameter values: generate uncached.
+            # Build minimal JSON structure - always a well-formed single_command,
+            # so it skips from_json's format detection and validation
+            return self._dispatch_json({
+                "type": "single_command",
+                "domain": domain,
+                "action": action,
+                "parameters": parameters
+            })
+        
+        try:
+            entry = self._simple_command_entry(domain, action, frozen_parameters)
+        except Exception as e:
+            self._logger.error(f"Error creating single QR command: {e}")
+            return []
+        return self._single_qr_commands(*entry)
+    
+    def _build_simple_command_entry(self, domain: str, action: str,
+                                    frozen_parameters: tuple) -> Tuple[str, CommandData]:
+        """Uncached from_simple_command() entry; raises on invalid commands so failures aren't memoized"""
+        return self._single_command_entry({
             "type": "single_command",
             "domain": domain,
             "action": action,
-            "parameters": parameters
-        }
-        
-        return self.from_json(json_data)
+            "parameters": {name: value for name, _, value in frozen_parameters}
+        })
     
     def _init_command_builders(self) -> Dict[tuple, Callable]:
         """
@@ -159,126 +252,147 @@ class DeviceCommandGenerator:
             ('lua_management', 'get_script_info'): self._build_get_script_info,
         }
     
+    @functools.cached_property
+    def _available_commands(self) -> str:
+        """Sorted 'domain.action' list for unsupported-command errors"""
+        return ', '.join(sorted(f"{d}.{a}" for (d, a) in self._command_builders))
+    
     # === Command Builders (Easy to add new ones!) ===
     
-    def _build_led_on(self, params: Dict) -> bytes:
+    def _build_led_on(self, params: Dict) -> Tuple[int, bytes]:
         """Build LED ON command"""
         led_id = params.get('led_id', 1)
-        cmd_obj = self._qr_core._led_builder.create_led_on_command(led_id)
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_led_on(led_id)
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_led_off(self, params: Dict) -> bytes:
+    def _build_led_off(self, params: Dict) -> Tuple[int, bytes]:
         """Build LED OFF command"""
         led_id = params.get('led_id', 1)
-        cmd_obj = self._qr_core._led_builder.create_led_off_command(led_id)
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_led_off(led_id)
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_led_blink(self, params: Dict) -> bytes:
+    def _build_led_blink(self, params: Dict) -> Tuple[int, bytes]:
         """Build LED BLINK command"""
         led_id = params.get('led_id', 1)
         frequency = params.get('frequency', 2.0)
-        payload = bytes([led_id]) + struct.pack('<f', frequency)
-        return bytes([Commands.LED_START_BLINK]) + payload
+        return Commands.LED_START_BLINK, _LED_BLINK_PAYLOAD.pack(led_id, frequency)
     
-    def _build_led_stop_blink(self, params: Dict) -> bytes:
+    def _build_led_stop_blink(self, params: Dict) -> Tuple[int, bytes]:
         """Build LED STOP BLINK command"""
         led_id = params.get('led_id', 1)
-        return bytes([Commands.LED_STOP_BLINK, led_id])
+        return Commands.LED_STOP_BLINK, bytes([led_id])
     
-    def _build_all_leds_off(self, params: Dict) -> bytes:
+    def _build_all_leds_off(self, params: Dict) -> Tuple[int, bytes]:
         """Build ALL LEDs OFF command"""
-        cmd_obj = self._qr_core._led_builder.create_all_leds_off_command()
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_all_leds_off()
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_play_melody(self, params: Dict) -> bytes:
+    def _build_play_melody(self, params: Dict) -> Tuple[int, bytes]:
         """Build PLAY MELODY command"""
         melody = params.get('melody', 'SUCCESS')
-        cmd_obj = self._qr_core._buzzer_builder.create_buzzer_melody_command(melody)
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_buzzer_melody(melody)
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_beep(self, params: Dict) -> bytes:
+    def _build_beep(self, params: Dict) -> Tuple[int, bytes]:
         """Build BEEP command"""
         duration = params.get('duration', 200)
         frequency = params.get('frequency', 1000)
-        payload = struct.pack('<HH', duration, frequency)
-        return bytes([Commands.BUZZER_BEEP]) + payload
+        return Commands.BUZZER_BEEP, _UINT16_PAIR_PAYLOAD.pack(duration, frequency)
     
-    def _build_set_volume(self, params: Dict) -> bytes:
+    def _build_set_volume(self, params: Dict) -> Tuple[int, bytes]:
         """Build SET VOLUME command"""
         volume = params.get('volume', 50)
-        return bytes([Commands.BUZZER_SET_CONFIG, volume])
+        return Commands.BUZZER_SET_CONFIG, bytes([volume])
     
-    def _build_set_orientation(self, params: Dict) -> bytes:
+    def _build_set_orientation(self, params: Dict) -> Tuple[int, bytes]:
         """Build SET ORIENTATION command"""
         orientation = params.get('orientation', 0)
         # Use existing builder method
-        cmd_obj = self._qr_core._device_builder.create_orientation_command(orientation)
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_orientation(orientation)
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_set_language(self, params: Dict) -> bytes:
+    def _build_set_language(self, params: Dict) -> Tuple[int, bytes]:
         """Build SET LANGUAGE command"""
         language = params.get('language_code', 0x040C)
         if isinstance(language, str):
             language = int(language, 16) if language.startswith('0x') else int(language)
         # Manual command building since no builder exists
-        import struct
-        payload = struct.pack('<I', language)  # 32-bit language code
-        return bytes([Commands.DEVICE_SET_LANGUAGE]) + payload
+        payload = _UINT32_PAYLOAD.pack(language)  # 32-bit language code
+        return Commands.DEVICE_SET_LANGUAGE, payload
     
-    def _build_set_auto_shutdown(self, params: Dict) -> bytes:
+    def _build_set_auto_shutdown(self, params: Dict) -> Tuple[int, bytes]:
         """Build SET AUTO SHUTDOWN command"""
         ble_timeout = params.get('ble_timeout', 30)
         activity_timeout = params.get('activity_timeout', 60)
         # Manual command building
-        payload = struct.pack('<HH', ble_timeout, activity_timeout)
-        return bytes([Commands.POWER_SET_AUTO_SHUTDOWN]) + payload
+        payload = _UINT16_PAIR_PAYLOAD.pack(ble_timeout, activity_timeout)
+        return Commands.POWER_SET_AUTO_SHUTDOWN, payload
     
-    def _build_shutdown(self, params: Dict) -> bytes:
+    def _build_shutdown(self, params: Dict) -> Tuple[int, bytes]:
         """Build SHUTDOWN command"""
-        return bytes([Commands.SYSTEM_SHUTDOWN])
+        return _SHUTDOWN_COMMAND
     
-    def _build_restart(self, params: Dict) -> bytes:
+    def _build_restart(self, params: Dict) -> Tuple[int, bytes]:
         """Build RESTART command"""
-        return bytes([Commands.SYSTEM_RESTART])
+        return _RESTART_COMMAND
     
-    def _build_deep_sleep(self, params: Dict) -> bytes:
+    def _build_deep_sleep(self, params: Dict) -> Tuple[int, bytes]:
         """Build DEEP SLEEP command"""
         duration = params.get('duration', 0)
         # Note: Implementation depends on ESP32 deep sleep command format
-        return bytes([0x74, duration & 0xFF, (duration >> 8) & 0xFF])  # Example
+        return 0x74, _UINT16_PAYLOAD.pack(duration & 0xFFFF)  # Example
     
-    def _build_clear_script(self, params: Dict) -> bytes:
+    def _build_clear_script(self, params: Dict) -> Tuple[int, bytes]:
         """Build CLEAR SCRIPT command"""
         # Use existing builder method  
-        cmd_obj = self._qr_core._device_builder.create_lua_clear_command()
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_lua_clear()
+        return cmd_obj.command_id, cmd_obj.payload
     
-    def _build_get_script_info(self, params: Dict) -> bytes:
+    def _build_get_script_info(self, params: Dict) -> Tuple[int, bytes]:
         """Build GET SCRIPT INFO command"""
         # Use existing builder method
-        cmd_obj = self._qr_core._device_builder.create_lua_info_command()
-        return bytes([cmd_obj.command_id]) + cmd_obj.payload
+        cmd_obj = self._create_lua_info()
+        return cmd_obj.command_id, cmd_obj.payload
 
-    def _build_binary_command(self, cmd_data: Dict[str, Any]) -> bytes:
+    def _build_binary_command(self, cmd_data: Dict[str, Any]) -> Tuple[int, bytes]:
         """
-        Build binary command from JSON command data using mapping table
+        Build (command_id, payload) from JSON command data using mapping table
         
         Much cleaner and easier to maintain than big if/else blocks!
         """
         domain = cmd_data.get('domain', '')
         action = cmd_data.get('action', '')
+        builder_key = (domain, action)  # Shared by every table lookup below
+        
+        # Static commands: precomputed in __init__, parameters never consulted
+        binary = self._constant_binaries.get(builder_key)
+        if binary is not None:
+            return binary
+        
         parameters = cmd_data.get('parameters', {})
         
+        # Repeated commands reuse the built (immutable) encoding
+        try:
+            cache_key = (builder_key, _freeze_parameters(parameters))
+            binary = self._binary_cache.get(cache_key)
+        except TypeError:
+            cache_key = binary = None  # Unhashable parameter values: build uncached
+        if binary is not None:
+            return binary
+        
         # Look up command builder in mapping table
-        builder_key = (domain, action)
         builder = self._command_builders.get(builder_key)
         
         if builder:
-            return builder(parameters)
+            binary = builder(parameters)
+            if cache_key is not None:
+                if len(self._binary_cache) >= _BINARY_CACHE_SIZE:
+                    self._binary_cache.clear()
+                self._binary_cache[cache_key] = binary
+            return binary
         else:
             # Command not supported - list available commands for better debugging
-            available = [f"{d}.{a}" for (d, a) in self._command_builders.keys()]
-            raise ValueError(f"Unsupported command: {domain}.{action}\nAvailable commands: {', '.join(sorted(available))}")
+            raise ValueError(f"Unsupported command: {domain}.{action}\nAvailable commands: {self._available_commands}")
     
     def _create_single_qr_command(self, json_data: Dict[str, Any]) -> List[QRCommand]:
         """
@@ -291,97 +405,103 @@ class DeviceCommandGenerator:
             List with single QRCommand object
         """
         try:
-            # Build binary command
-            binary_command = self._build_binary_command(json_data)
-            
-            if not binary_command:
-                self._logger.error("Failed to build binary command")
-                return []
-            
-            # Format as QR command
-            import base64
-            encoded = base64.b64encode(binary_command).decode('utf-8')
-            qr_data = f"$DCMD:{encoded}$"
-            
-            # Create QRCommand object
-            from .utils.qr_core import QRCommand, CommandData
-            cmd_data = CommandData(
-                command_id=binary_command[0] if binary_command else 0,
-                payload=binary_command[1:] if len(binary_command) > 1 else b'',
-                domain="device",  # Device domain commands
-                command_type="Device Command",
-                description=f"{json_data.get('domain', '')}.{json_data.get('action', '')}",
-                metadata={"format": "single"}
-            )
-            
-            # Return QRCommand with pre-formatted data
-            qr_cmd = QRCommand(cmd_data)
-            qr_cmd.command_data = qr_data  # Override with our formatted data
-            return [qr_cmd]
-            
+            return self._single_qr_commands(*self._single_command_entry(json_data))
         except Exception as e:
             self._logger.error(f"Error creating single QR command: {e}")
             return []
     
+    def _single_command_entry(self, json_data: Dict[str, Any]) -> Tuple[str, CommandData]:
+        """$DCMD: string and CommandData for a single device command"""
+        # Build binary command
+        command_id, payload = self._build_binary_command(json_data)
+        
+        # Format as QR command (wrapped as bytes, decoded once)
+        encoded = binascii.b2a_base64(bytes([command_id]) + payload, newline=False)
+        qr_data = b''.join((b'$DCMD:', encoded, b'$')).decode('ascii')
+        
+        cmd_data = CommandData(
+            command_id=command_id,
+            payload=payload,
+            domain="device",  # Device domain commands
+            command_type="Device Command",
+            description=f"{json_data.get('domain', '')}.{json_data.get('action', '')}",
+            metadata={"format": "single"}
+        )
+        return qr_data, cmd_data
+    
+    @staticmethod
+    def _single_qr_commands(qr_data: str, cmd_data: CommandData) -> List[QRCommand]:
+        """New QRCommand list for a single command entry"""
+        # Return QRCommand with pre-formatted data
+        qr_cmd = QRCommand(cmd_data)
+        qr_cmd.command_data = qr_data  # Override with our formatted data
+        return [qr_cmd]
+    
     def _create_batch_qr_command(self, json_data: Dict[str, Any]) -> List[QRCommand]:
         """
         Create a single QR code containing multiple device commands
         Format: $BATCH:base64_encoded_binary_commands$
         Binary format: [count][len1][cmd1][len2][cmd2]...
         """
-        import base64
-        import struct
-        
         # Extract commands and metadata
         commands_data = json_data['commands']
         metadata = json_data.get('metadata', {})
         
-        # Use shared command parser utility
-        from ..utils.command_parser import CommandParser
+        # Single streaming pass over the (already validated) commands: each one
+        # is encoded by the shared parser straight into the batch buffer, and its
+        # type recorded for the description
+        # Batch binary format: [count][len1][cmd1][len2][cmd2]...
+        batch_binary = bytearray(1)  # Command count, filled in once known
+        encoded_count = 0
+        command_types = {}  # Ordered set of "domain.action" names (values unused)
         
-        try:
-            # Parse JSON to binary commands using shared utility
-            commands = CommandParser.parse_json_commands(json_data)
-            # Convert to old format for compatibility with batch creation
-            binary_commands = []
-            for command_id, payload in commands:
-                binary_commands.append(bytes([command_id]) + payload)
-        except Exception as e:
-            self._logger.error(f"Error parsing commands: {e}")
-            return []
+        # Loop-invariant lookups bound once
+        parse_command = CommandParser._parse_kiss_command
+        append_byte = batch_binary.append
+        extend = batch_binary.extend
+        
+        for cmd in commands_data:
+            command_type = f"{cmd['domain']}.{cmd['action']}"
+            command_types[command_type] = None
+            try:
+                command_id, payload = parse_command(cmd)
+            except (KeyError, ValueError, TypeError, AttributeError, struct.error) as e:
+                self._logger.error(f"Error parsing command {command_type}: {e}")
+                continue
+            try:
+                append_byte(1 + len(payload))  # length
+                append_byte(command_id)  # command
+                extend(payload)
+            except ValueError as e:
+                self._logger.error(f"Failed to encode batch commands: {e}")
+                return []
+            encoded_count += 1
         
-        if not binary_commands:
+        if not encoded_count:
             self._logger.error("No valid commands to batch")
             return []
         
-        # Build batch binary format: [count][len1][cmd1][len2][cmd2]...
         try:
-            batch_binary = struct.pack('B', len(binary_commands))  # command count
-            for cmd_binary in binary_commands:
-                batch_binary += struct.pack('B', len(cmd_binary)) + cmd_binary  # length + command
+            batch_binary[0] = encoded_count
             
-            # Base64 encode the binary data
-            b64_data = base64.b64encode(batch_binary).decode('ascii')
-        except Exception as e:
+            # Base64 encode the binary data (binascii directly, reading the buffer in place)
+            b64_data = binascii.b2a_base64(batch_binary, newline=False)
+        except ValueError as e:  # More than 255 commands
             self._logger.error(f"Failed to encode batch commands: {e}")
             return []
         
-        # Create batch QR command
-        command_data = f"$BATCH:{b64_data}$"
+        # Create batch QR command (wrapped as bytes, decoded once)
+        command_data = b''.join((b'$BATCH:', b64_data, b'$')).decode('ascii')
         
         # Generate description
         command_count = len(commands_data)
-        command_types = set()
-        for cmd in commands_data:
-            command_types.add(f"{cmd['domain']}.{cmd['action']}")
-        
-        description = f"Device Batch: {command_count} commands ({', '.join(sorted(command_types))})"
+        description = f"Device Batch: {command_count} commands ({', '.join(command_types)})"
         
         # Create metadata
         qr_metadata = {
             'qr_format': 'BATCH',
             'command_count': command_count,
-            'commands': command_types,
+            'commands': set(command_types),
             'binary_size_bytes': len(batch_binary),
             'base64_size_chars': len(b64_data),
             'qr_size_chars': len(command_data),
@@ -389,9 +509,7 @@ class DeviceCommandGenerator:
         }
         
         # Use legacy QRCommand class for direct string command
-        from ..controllers.qr_generator import QRCommand
-        
-        batch_qr = QRCommand(
+        batch_qr = LegacyQRCommand(
             command_data,
             "Device Batch Commands",
             description,
@@ -400,43 +518,23 @@ class DeviceCommandGenerator:
         
         return [batch_qr]
     
-    def _process_single_command(self, cmd_json: Dict[str, Any]) -> Optional[QRCommand]:
-        """Process a single device command from JSON"""
-        domain = cmd_json['domain']
-        action = cmd_json['action']
-        params = cmd_json.get('parameters', {})
-        
-        # LED Control
-        if domain == 'led_control':
-            if action == 'led_on':
-                return self._qr_core.create_led_on_command(params['led_id'])
-            elif action == 'led_off':
-                return self._qr_core.create_led_off_command(params['led_id'])
-            elif action == 'all_leds_off':
-                return self._qr_core.create_all_leds_off_command()
-        
-        # Buzzer Control
-        elif domain == 'buzzer_control':
-            if action == 'play_melody':
-                return self._qr_core.create_buzzer_melody_command(params['melody'])
-        
-        # Device Settings
-        elif domain == 'device_settings':
-            if action == 'set_orientation':
-                return self._qr_core.create_orientation_command(params['orientation'])
-        
-        # Lua Management
-        elif domain == 'lua_management':
-            if action == 'clear_script':
-                return self._qr_core.create_lua_clear_command()
-            elif action == 'get_script_info':
-                return self._qr_core.create_lua_info_command()
-        
-        self._logger.warning(f"Unsupported command: {domain}.{action}")
-        return None
-    
     # ===== Traditional API =====
     
+    # Parameter-less command payloads, built on first use; every call still
+    # gets its own QRCommand
+    
+    @functools.cached_property
+    def _all_leds_off_data(self) -> CommandData:
+        return self._create_all_leds_off()
+    
+    @functools.cached_property
+    def _lua_clear_data(self) -> CommandData:
+        return self._create_lua_clear()
+    
+    @functools.cached_property
+    def _lua_info_data(self) -> CommandData:
+        return self._create_lua_info()
+    
     def create_led_on_command(self, led_id: int) -> QRCommand:
         """Create LED ON command (traditional API)"""
         return self._qr_core.create_led_on_command(led_id)
@@ -447,7 +545,7 @@ class DeviceCommandGenerator:
     
     def create_all_leds_off_command(self) -> QRCommand:
         """Create all LEDs OFF command (traditional API)"""
-        return self._qr_core.create_all_leds_off_command()
+        return QRCommand(self._all_leds_off_data, self._qr_core._formatter)
     
     def create_buzzer_melody_command(self, melody_name: str) -> QRCommand:
         """Create buzzer melody command (traditional API)"""
@@ -459,11 +557,11 @@ class DeviceCommandGenerator:
     
     def create_lua_clear_command(self) -> QRCommand:
         """Create Lua script clear command (traditional API)"""
-        return self._qr_core.create_lua_clear_command()
+        return QRCommand(self._lua_clear_data, self._qr_core._formatter)
     
     def create_lua_info_command(self) -> QRCommand:
         """Create Lua script info command (traditional API)"""
-        return self._qr_core.create_lua_info_command()
+        return QRCommand(self._lua_info_data, self._qr_core._formatter)
     
     # ===== Utility Methods =====
     
@@ -13,6 +13,7 @@ from pathlib import Path
 
 from .utils.json_support import JSONValidator, JSONConverter
 from .utils.qr_core import QRCore, QRCommand
+from ..controllers.qr.commands import DIGIT_ACTIONS
 from ..utils.constants import HIDKeyCodes
 
 
@@ -134,13 +135,8 @@ class KeyboardConfigGenerator:
         Returns:
             QRCommand with numeric keypad layout
         """
-        config = {}
-        
         # Keys 0-9 with corresponding numbers
-        for i in range(10):
-            config[i] = [self.create_text_action(str(i))]
-            
-        return self.create_full_keyboard_config(config)
+        return self._qr_core.create_text_layout_config({i: str(i) for i in range(10)})
     
     def create_alpha_config(self) -> QRCommand:
         """
@@ -149,14 +145,10 @@ class KeyboardConfigGenerator:
         Returns:
             QRCommand with alphabetic layout
         """
-        config = {}
-        
         # Keys 0-15 with letters A-P
-        for i in range(16):
-            letter = chr(ord('A') + i)  # A, B, C, ..., P
-            config[i] = [self.create_text_action(letter)]
-            
-        return self.create_full_keyboard_config(config)
+        return self._qr_core.create_text_layout_config(
+            {i: chr(ord('A') + i) for i in range(16)}  # A, B, C, ..., P
+        )
     
     def create_function_keys_config(self) -> QRCommand:
         """
@@ -187,11 +179,8 @@ class KeyboardConfigGenerator:
         Returns:
             QRCommand with arrow keys + numpad layout
         """
-        config = {}
-        
         # Numbers 0-9 on keys 0-9
-        for i in range(10):
-            config[i] = [self.create_text_action(str(i))]
+        config = {i: [DIGIT_ACTIONS[i]] for i in range(10)}
         
         # Arrow keys on keys 12-15
         config[12] = [self.create_hid_action(HIDKeyCodes.UP_ARROW)]    # ↑
@@ -212,11 +201,8 @@ class KeyboardConfigGenerator:
         Returns:
             QRCommand optimized for warehouse operations
         """
-        config = {}
-        
         # Numbers for quantity/item codes
-        for i in range(10):
-            config[i] = [self.create_text_action(str(i))]
+        config = {i: [DIGIT_ACTIONS[i]] for i in range(10)}
         
         # Common warehouse operations
         config[10] = [self.create_text_action("QTY: ")]               # Quantity prefix
@@ -235,11 +221,8 @@ class KeyboardConfigGenerator:
         Returns:  
             QRCommand optimized for POS operations
         """
-        config = {}
-        
         # Numbers for prices/quantities
-        for i in range(10):
-            config[i] = [self.create_text_action(str(i))]
+        config = {i: [DIGIT_ACTIONS[i]] for i in range(10)}
         
         # POS operations
         config[10] = [self.create_text_action(".")]                   # Decimal point
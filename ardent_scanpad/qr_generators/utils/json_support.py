@@ -12,6 +12,67 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+# ===== Specialized happy-path checks =====
+# Straight-line checks per action type / device command, with no error strings
+# built. A False result means the interpreted validator below re-runs on that
+# item to raise its detailed error.
+
+def _text_action_ok(action: Dict[str, Any]) -> bool:
+    if 'value' not in action:
+        return False
+    text = action['value']
+    return isinstance(text, str) and len(text.encode('utf-8')) <= 8
+
+
+def _hid_action_ok(action: Dict[str, Any]) -> bool:
+    if 'keycode' not in action:
+        return False
+    keycode = action['keycode']
+    modifier = action.get('modifier', 0)
+    return (isinstance(keycode, int) and 0 <= keycode <= 255 and
+            isinstance(modifier, int) and 0 <= modifier <= 255)
+
+
+def _consumer_action_ok(action: Dict[str, Any]) -> bool:
+    if 'control_code' not in action:
+        return False
+    code = action['control_code']
+    return isinstance(code, int) and 0 <= code <= 65535
+
+
+_ACTION_CHECKS = {
+    'text': _text_action_ok,
+    'hid': _hid_action_ok,
+    'consumer': _consumer_action_ok,
+}
+
+
+def _action_ok(action: Any) -> bool:
+    if not isinstance(action, dict):
+        return False
+    action_type = action.get('type')
+    if not isinstance(action_type, str):
+        return False
+    check = _ACTION_CHECKS.get(action_type)
+    return check is not None and check(action)
+
+
+_VALID_KEYBOARD_TYPES = ('keyboard_configuration', 'full_keyboard')
+_VALID_DEVICE_TYPES = ['device_command', 'device_batch', 'single_command']
+_VALID_EXTERNAL_BUTTONS = frozenset({"scan_trigger_double", "scan_trigger_long", "power_single", "power_double"})
+_VALID_DEVICE_DOMAINS = ['device_settings', 'led_control', 'buzzer_control', 'power_management', 'lua_management']
+_VALID_DEVICE_DOMAIN_SET = frozenset(_VALID_DEVICE_DOMAINS)
+
+
+def _device_command_ok(cmd: Any) -> bool:
+    if not isinstance(cmd, dict) or 'domain' not in cmd or 'action' not in cmd:
+        return False
+    domain = cmd['domain']
+    return (isinstance(domain, str) and domain in _VALID_DEVICE_DOMAIN_SET and
+            isinstance(cmd['action'], str) and
+            ('parameters' not in cmd or isinstance(cmd['parameters'], dict)))
+
+
 class JSONValidator:
     """JSON validation and parsing"""
     
@@ -48,7 +109,7 @@ class JSONValidator:
         """Validate keyboard configuration JSON structure"""
         JSONValidator.validate_json_structure(data, ['type'])
         
-        if data.get('type') not in ['keyboard_configuration', 'full_keyboard']:
+        if data.get('type') not in _VALID_KEYBOARD_TYPES:
             raise ValueError(f"Invalid type for keyboard JSON: {data.get('type')}")
         
         # Support both modern KISS format (keys) and legacy format (matrix_keys)
@@ -84,7 +145,8 @@ class JSONValidator:
                 raise ValueError(f"Key {key_id} has too many actions (max 10): {len(actions)}")
             
             for i, action in enumerate(actions):
-                JSONValidator._validate_action(action, f"Key {key_id} action {i}")
+                if not _action_ok(action):
+                    JSONValidator._validate_action(action, f"Key {key_id} action {i}")
         
         # Validate external_buttons if present in legacy format
         if 'external_buttons' in data:
@@ -92,9 +154,8 @@ class JSONValidator:
             if not isinstance(external_buttons, dict):
                 raise ValueError("external_buttons must be an object")
             
-            valid_buttons = {"scan_trigger_double", "scan_trigger_long", "power_single", "power_double"}
             for button_name, actions in external_buttons.items():
-                if button_name not in valid_buttons:
+                if button_name not in _VALID_EXTERNAL_BUTTONS:
                     raise ValueError(f"Invalid external button name: {button_name}")
                 
                 if not isinstance(actions, list) or not actions:
@@ -104,16 +165,16 @@ class JSONValidator:
                     raise ValueError(f"External button {button_name} has too many actions (max 10): {len(actions)}")
                 
                 for i, action in enumerate(actions):
-                    JSONValidator._validate_action(action, f"External button {button_name} action {i}")
+                    if not _action_ok(action):
+                        JSONValidator._validate_action(action, f"External button {button_name} action {i}")
     
     @staticmethod
     def validate_device_json(data: Dict[str, Any]) -> None:
         """Validate device command JSON structure"""
         JSONValidator.validate_json_structure(data, ['type'])
         
-        valid_types = ['device_command', 'device_batch', 'single_command']
-        if data.get('type') not in valid_types:
-            raise ValueError(f"Invalid type for device JSON: {data.get('type')} (must be one of {valid_types})")
+        if data.get('type') not in _VALID_DEVICE_TYPES:
+            raise ValueError(f"Invalid type for device JSON: {data.get('type')} (must be one of {_VALID_DEVICE_TYPES})")
         
         # Validate commands if present
         if 'commands' in data:
@@ -122,7 +183,8 @@ class JSONValidator:
                 raise ValueError("commands must be a list")
             
             for i, cmd in enumerate(commands):
-                JSONValidator._validate_device_command(cmd, f"Command {i}")
+                if not _device_command_ok(cmd):
+                    JSONValidator._validate_device_command(cmd, f"Command {i}")
     
     @staticmethod
     def _validate_action(action: Dict[str, Any], context: str) -> None:
@@ -184,9 +246,8 @@ class JSONValidator:
         action = cmd['action']
         
         # Basic validation - specific validation done in generators
-        valid_domains = ['device_settings', 'led_control', 'buzzer_control', 'power_management', 'lua_management']
-        if domain not in valid_domains:
-            raise ValueError(f"{context}: invalid domain '{domain}' (must be one of {valid_domains})")
+        if domain not in _VALID_DEVICE_DOMAINS:
+            raise ValueError(f"{context}: invalid domain '{domain}' (must be one of {_VALID_DEVICE_DOMAINS})")
         
         if not isinstance(action, str):
             raise ValueError(f"{context}: action must be string")
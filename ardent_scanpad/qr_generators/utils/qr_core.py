@@ -11,7 +11,7 @@ from ...controllers.qr.commands import (
     FullConfigCommandBuilder, LuaCommandBuilder
 )
 from ...controllers.qr.formats import QRFormatter
-from ...controllers.qr.images import QRImageSaver
+from ...controllers.qr.images import QRImageSaver, shared_image_saver
 
 
 class QRCommand:
@@ -20,19 +20,39 @@ class QRCommand:
     Bridges new modular system with legacy QRCommand interface
     """
     
+    __slots__ = (
+        '_command_data', '_qr_formatter',
+        'command_data', 'command_type', 'description', 'metadata',
+        '_command_bytes'
+    )
+    
     def __init__(self, command_data: CommandData, qr_formatter: QRFormatter = None):
         self._command_data = command_data
         self._qr_formatter = qr_formatter or QRFormatter()
-        self._qr_image_saver = QRImageSaver()
         
         # Generate formatted QR string
         self.command_data = self._qr_formatter.format_command(command_data)
         self.command_type = command_data.command_type
         self.description = command_data.description
         self.metadata = command_data.metadata.copy()
+        self._command_bytes = None
+    
+    @property
+    def command_bytes(self) -> memoryview:
+        """Encoded command_data for transports, encoded once per command string"""
+        cached = self._command_bytes
+        if cached is None or cached[0] is not self.command_data:
+            cached = self._command_bytes = (self.command_data, self.command_data.encode('utf-8'))
+        return memoryview(cached[1])
+    
+    @property
+    def _qr_image_saver(self) -> QRImageSaver:
+        """Image saver shared by all commands"""
+        return shared_image_saver()
     
     def generate_qr_image(self, **kwargs):
-        """Generate QR image using modular system"""
+        """Generate QR image using modular system (pass add_title=False to skip the banner)"""
+        kwargs.setdefault('add_title', self.metadata.get('add_title', True))
         return self._qr_image_saver._generator.generate_qr_image(
             self.command_data,
             title=self.command_type,
@@ -40,6 +60,16 @@ class QRCommand:
             **kwargs
         )
     
+    def to_png_bytes(self, **kwargs) -> bytes:
+        """PNG-encoded QR image, without a filesystem round-trip"""
+        kwargs.setdefault('add_title', self.metadata.get('add_title', True))
+        return self._qr_image_saver.qr_png_bytes(
+            self.command_data,
+            title=self.command_type,
+            description=self.description,
+            **kwargs
+        )
+    
     def save(self, filename, **kwargs) -> bool:
         """Save QR code as PNG"""
         return self._qr_image_saver.save_qr_image(
@@ -68,7 +98,11 @@ class QRCore:
         self._full_builder = FullConfigCommandBuilder()
         self._lua_builder = LuaCommandBuilder()
         self._formatter = QRFormatter()
-        self._image_saver = QRImageSaver()
+    
+    @property
+    def _image_saver(self) -> QRImageSaver:
+        """Image saver shared by all commands, created on the first save"""
+        return shared_image_saver()
     
     # ===== LED Commands =====
     def create_led_on_command(self, led_id: int) -> QRCommand:
@@ -124,9 +158,14 @@ class QRCore:
         cmd_data = self._full_builder.create_full_keyboard_config(keyboard_config, compression_level)
         return QRCommand(cmd_data, self._formatter)
     
+    def create_text_layout_config(self, key_texts: Dict[int, str],
+                                  compression_level: int = 6) -> QRCommand:
+        cmd_data = self._full_builder.create_text_layout_config(key_texts, compression_level)
+        return QRCommand(cmd_data, self._formatter)
+    
     # ===== Lua Scripts =====
     def create_lua_script_qr(self, script_content: str, max_qr_size: int = 1000, 
-                            compression_level: int = 6) -> List[QRCommand]:
+                            compression_level: int = None) -> List[QRCommand]:
         cmd_data_list = self._lua_builder.create_lua_script_commands(
             script_content, max_qr_size, compression_level
         )
@@ -138,8 +177,9 @@ class QRCore:
     
     # ===== Batch Operations =====
     def save_multiple_qr_codes(self, commands: List[QRCommand], output_dir, 
-                              filename_prefix: str = "qr_", **kwargs) -> List[str]:
-        """Save multiple QR codes using modular image system"""
+                              filename_prefix: str = "qr_", max_workers: int = None,
+                              **kwargs) -> List[str]:
+        """Save multiple QR codes in parallel using modular image system"""
         qr_data_list = []
         
         for cmd in commands:
@@ -150,7 +190,7 @@ class QRCore:
             })
         
         return self._image_saver.save_multiple_qr_images(
-            qr_data_list, output_dir, filename_prefix, **kwargs
+            qr_data_list, output_dir, filename_prefix, max_workers=max_workers, **kwargs
         )
     
     def save_lua_script_qr_sequence(self, script_content: str, output_dir, 
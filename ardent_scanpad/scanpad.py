@@ -584,7 +584,7 @@ class ScanPad:
     
     async def _setup_notifications(self) -> None:
         """Setup BLE notification handlers"""
-        # Use default notification handler which stores responses in connection._received_responses
+        # Use default notification handler which queues responses on the connection
         await self.connection.setup_notifications()
         logger.debug("BLE notifications configured")
     
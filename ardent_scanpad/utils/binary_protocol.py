@@ -106,15 +106,19 @@ class BinaryProtocol:
         if not commands:
             raise ValueError("No commands to batch")
         
-        # Start with command count
-        batch_binary = struct.pack('B', len(commands))
+        # Sized up front: [count] then [length][command_id][payload] per command
+        batch_binary = bytearray(1 + sum(2 + len(payload) for _, payload in commands))
+        batch_binary[0] = len(commands)
         
-        # Add each command: [length][command_id][payload]
+        offset = 1
         for command_id, payload in commands:
-            cmd_binary = bytes([command_id]) + payload
-            batch_binary += struct.pack('B', len(cmd_binary)) + cmd_binary
+            end = offset + 2 + len(payload)
+            batch_binary[offset] = 1 + len(payload)
+            batch_binary[offset + 1] = command_id
+            batch_binary[offset + 2:end] = payload
+            offset = end
         
-        return batch_binary
+        return bytes(batch_binary)
     
     @staticmethod
     def parse_batch_command(batch_data: bytes) -> List[Tuple[int, bytes]]:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the direct 1-bit PNG encoder used for untitled QR codes
+
+Tests:
+1. Encoded PNG decodes with Pillow as a 1-bit image of the same size
+2. Decoded pixels match the _render_qr bitmap, including widths that are
+   not a multiple of 8 (partial last byte per row)
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# Add library to path
+lib_path = Path(__file__).parent
+sys.path.insert(0, str(lib_path))
+
+from ardent_scanpad.controllers.qr import images
+
+# (qr_data, size) - sizes cover byte-aligned and ragged row widths
+CASES = [
+    ("$CMD:DEV:100101CMD$", 64),
+    ("$CMD:DEV:100101CMD$", 300),
+    ("$FULL:" + "ab" * 200 + "$", 157),
+    ("x", 50),
+]
+
+
+def test_png_1bit_roundtrip():
+    if not images._qr_available():
+        print("⚠️  qrcode/PIL not installed - skipping")
+        return
+    from PIL import Image
+
+    for qr_data, size in CASES:
+        bitmap = images._render_qr(qr_data, "", "", size, 4, 0, 0)
+        assert bitmap.mode == '1'
+
+        for compress_level in (1, 9):
+            png = images._encode_png_1bit(bitmap, compress_level)
+            decoded = Image.open(io.BytesIO(png))
+            decoded.load()
+
+            assert decoded.format == 'PNG'
+            assert decoded.mode == '1', decoded.mode
+            assert decoded.size == bitmap.size, (decoded.size, bitmap.size)
+            assert decoded.tobytes() == bitmap.tobytes(), f"pixel mismatch at size {size}"
+
+        print(f"✅ {size}x{size} (width % 8 = {size % 8}) decodes pixel-identical")
+
+
+def main():
+    print("=" * 60)
+    print("Testing direct 1-bit PNG encoder")
+    print("=" * 60)
+
+    try:
+        test_png_1bit_roundtrip()
+    except AssertionError as e:
+        print(f"❌ FAILED: {e}")
+        return 1
+
+    print("\n✅ All PNG encoder checks passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())